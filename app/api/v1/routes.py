@@ -7,14 +7,16 @@
 from operator import ge
 from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, Path, status, BackgroundTasks, HTTPException, Body
+from sqlalchemy import update
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 from pydantic import BaseModel, Field
 import uuid
 import logging, time
 from datetime import timezone
 
-from app.db.database import get_db, SessionLocal
+from app.db.database import get_db, SessionLocal, is_duplicate_key_error
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.models.route import Route, RouteOption, SavedRoute, RouteGenerationTask, RouteShape, generate_uuid, Place
@@ -224,14 +226,14 @@ async def generate_route_background(task_id: str, db: Session):
         db.commit()
         
     except Exception as e:
-        # 에러 발생 시 Task 상태 업데이트
-        task = db.query(RouteGenerationTask).filter(
-            RouteGenerationTask.id == task_id
-        ).first()
-        if task:
-            task.status = "failed"
-            task.error_message = str(e)
-            db.commit()
+        # 에러 발생 시 Task 상태 업데이트 (SELECT 없이 UPDATE 한 번, 없는 Task면 0행 갱신)
+        db.execute(
+            update(RouteGenerationTask)
+            .where(RouteGenerationTask.id == task_id)
+            .values(status="failed", error_message=str(e))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
 
 
 # ============================================
@@ -571,26 +573,23 @@ def save_route(
         route.name = custom_name.strip()
         db.commit()
     
-    # 이미 저장했는지 확인
-    existing = db.query(SavedRoute).filter(
-        SavedRoute.user_id == current_user.id,
-        SavedRoute.route_id == route_id
-    ).first()
-    
-    if existing:
-        raise ValidationException(
-            message="이미 저장한 경로입니다",
-            field="route_id"
-        )
-    
-    # 저장
+    # 저장 (SELECT로 먼저 확인하지 않고 INSERT 후 유니크 제약조건 위반으로 중복 판단)
     saved_route = SavedRoute(
         user_id=current_user.id,
         route_id=route_id,
         route_option_id=route_option_id,
     )
     db.add(saved_route)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if is_duplicate_key_error(e):
+            raise ValidationException(
+                message="이미 저장한 경로입니다",
+                field="route_id"
+            )
+        raise
     
     return CommonResponse(
         success=True,
@@ -749,7 +748,8 @@ async def recommend_route(
     AI 기반 경로 추천 엔드포인트
     (거리/시간 정확도 개선)
     """
-    from app.services.road_network import RoadNetworkFetcher
+    from app.services.road_network import get_road_network_fetcher, csgraph_shortest_path, get_node_arrays, query_ring
+    import numpy as np
     
     user_location = (request.lat, request.lng)
     
@@ -774,7 +774,7 @@ async def recommend_route(
 
     try:
         # 1. RoadNetworkFetcher 초기화
-        fetcher = RoadNetworkFetcher()
+        fetcher = get_road_network_fetcher()
         
         # 2. 먼저 페이스 계산하여 target_dist_km 결정
         # 컨디션별 페이스 설정 (분/km) - 10km 최대 제한에 맞춰 조정
@@ -822,9 +822,8 @@ async def recommend_route(
         
         # logger.info(f"Fetching network with radius {radius_meter}m...")
         import asyncio
-        # OSMnx 호출은 CPU 및 I/O 집약적인 동기 함수이므로 쓰레드 풀에서 실행
-        G = await asyncio.to_thread(
-            fetcher.fetch_pedestrian_network_from_point,
+        # OSMnx 호출은 CPU 및 I/O 집약적인 동기 함수이므로 쓰레드 풀에서 실행 (같은 지역 동시 요청은 병합)
+        G = await fetcher.fetch_pedestrian_network_async(
             center_point=user_location,
             distance=radius_meter
         )
@@ -832,8 +831,17 @@ async def recommend_route(
         # ----------------------------
         # 경사도 로직 추가
         # ----------------------------
+        # 출발지 노드 찾기
+        orig_node = ox.distance.nearest_nodes(G, user_location[1], user_location[0])
+        # 반환점 후보 탐색용 노드 좌표 배열 (그래프에 캐시됨)
+        node_arrays = get_node_arrays(G)
+        
         # 1. 고도 추가 (SRTM 로컬 데이터)
-        await asyncio.to_thread(fetcher.add_elevation_to_nodes, G)
+        # 루프 경로 위 노드는 출발지에서 도로 거리로 목표 거리 이내이므로 그 범위만 조회
+        await asyncio.to_thread(
+            fetcher.add_elevation_to_nodes, G,
+            origin=orig_node, max_distance=target_dist_km * 1000
+        )
         # 2. 경사도 및 가중치 계산
         fetcher.calculate_edge_grades_and_weights(G)
         
@@ -846,9 +854,6 @@ async def recommend_route(
         
         # (페이스 계산은 이미 윗부분에서 완료됨)
         
-        # 출발지 노드 찾기
-        orig_node = ox.distance.nearest_nodes(G, user_location[1], user_location[0])
-        
         for i, config in enumerate(route_configs):
             route_data = None
             weight_key = config["weight"]
@@ -867,73 +872,41 @@ async def recommend_route(
                     min_dist = current_target_radius_m * 0.85
                     max_dist = current_target_radius_m * 1.15
                     
-                    candidate_nodes = []
-                    for node, data in G.nodes(data=True):
-                        node_lat = float(data['lat'])
-                        node_lng = float(data['lon'])
-                        dist = ox.distance.great_circle(user_location[0], user_location[1], node_lat, node_lng)
+                    # 전체 노드를 훑지 않고 캐시된 BallTree로 목표 반경 고리 안의 노드만 조회
+                    in_ring = query_ring(G, user_location[0], user_location[1], min_dist, max_dist)
+                    dest_node = None
+                    if in_ring.size:
+                        # 방위각 계산 (반경 조건을 만족하는 노드만, 한 번의 NumPy 연산)
+                        lat1 = math.radians(user_location[0])
+                        lat2 = np.radians(node_arrays.ys[in_ring])
+                        dlng = np.radians(node_arrays.xs[in_ring] - user_location[1])
+                        y = np.sin(dlng) * np.cos(lat2)
+                        x = math.cos(lat1) * np.sin(lat2) - math.sin(lat1) * np.cos(lat2) * np.cos(dlng)
+                        calc_bearing = (np.degrees(np.arctan2(y, x)) + 360) % 360
                         
-                        if min_dist <= dist <= max_dist:
-                            y = math.sin(math.radians(node_lng - user_location[1])) * math.cos(math.radians(node_lat))
-                            x = math.cos(math.radians(user_location[0])) * math.sin(math.radians(node_lat)) - \
-                                math.sin(math.radians(user_location[0])) * math.cos(math.radians(node_lat)) * \
-                                math.cos(math.radians(node_lng - user_location[1]))
-                            calc_bearing = math.degrees(math.atan2(y, x))
-                            calc_bearing = (calc_bearing + 360) % 360
-                            
-                            angle_diff = abs(calc_bearing - bearing)
-                            angle_diff = min(angle_diff, 360 - angle_diff)
-                            
-                            if angle_diff < 40:
-                                candidate_nodes.append((node, angle_diff, dist))
-                    
-                    if candidate_nodes:
-                        candidate_nodes.sort(key=lambda x: x[1])
-                        dest_node = candidate_nodes[0][0]
-                    else:
-                        user_lat_float = float(user_location[0])
-                        user_lng_float = float(user_location[1])
-                        possible_nodes = [
-                            n for n, d in G.nodes(data=True) 
-                            if min_dist <= ox.distance.great_circle(
-                                user_lat_float, user_lng_float,
-                                float(d['lat']), float(d['lon'])
-                            ) <= max_dist
-                        ]
-                        if possible_nodes:
-                            dest_node = random.choice(possible_nodes)
+                        angle_diff = np.abs(calc_bearing - bearing % 360)
+                        angle_diff = np.minimum(angle_diff, 360 - angle_diff)
+                        
+                        in_direction = angle_diff < 40
+                        if in_direction.any():
+                            # 각도 차가 가장 작은 노드
+                            candidates_idx = in_ring[in_direction]
+                            dest_node = node_arrays.node_ids[candidates_idx[np.argmin(angle_diff[in_direction])]].item()
                         else:
-                            continue
+                            dest_node = node_arrays.node_ids[random.choice(in_ring.tolist())].item()
+                    if dest_node is None:
+                        continue
                     
-                    # 경로 계산 (왕복)
-                    route_to = nx.shortest_path(G, orig_node, dest_node, weight=weight_key)
+                    # 경로 계산 (왕복) - 캐시된 CSR 가중치 행렬에서 SciPy 다익스트라
+                    route_to = csgraph_shortest_path(G, orig_node, dest_node, weight=weight_key)
                     
-                    # 오는 길 (가는 길 피해서)
-                    edges_to_penalize = []
+                    # 오는 길 (가는 길 피해서) - 그래프 가중치 대신 행렬 복사본에 페널티 적용
                     try:
-                        for u, v in zip(route_to[:-1], route_to[1:]):
-                            if G.has_edge(u, v):
-                                edge_data = G[u][v]
-                                if isinstance(edge_data, dict) and weight_key in edge_data:
-                                    edges_to_penalize.append((u, v, edge_data[weight_key]))
-                                    edge_data[weight_key] *= 10
-                                else:
-                                    for key in edge_data:
-                                        if isinstance(edge_data[key], dict) and weight_key in edge_data[key]:
-                                            edges_to_penalize.append((u, v, key, edge_data[key][weight_key]))
-                                            edge_data[key][weight_key] *= 10
-                        
-                        route_from = nx.shortest_path(G, dest_node, orig_node, weight=weight_key)
+                        route_from = csgraph_shortest_path(
+                            G, dest_node, orig_node, weight=weight_key, penalize_path=route_to
+                        )
                     except nx.NetworkXNoPath:
                         route_from = route_to[::-1]
-                    finally:
-                        for item in edges_to_penalize:
-                            if len(item) == 3:
-                                u, v, original_val = item
-                                G[u][v][weight_key] = original_val
-                            elif len(item) == 4:
-                                u, v, key, original_val = item
-                                G[u][v][key][weight_key] = original_val
                     
                     if not route_from:
                         route_from = route_to[::-1]
@@ -1133,14 +1106,13 @@ async def prefetch_elevation(
 
 async def run_elevation_prefetch(lat: float, lng: float, radius: float, db: Session = None):
     """백그라운드에서 실행되는 고도 프리페치 (SRTM은 자동 캐싱하므로 네트워크만 미리 로드)"""
-    from app.services.road_network import RoadNetworkFetcher
+    from app.services.road_network import get_road_network_fetcher
     import asyncio
     
     try:
-        fetcher = RoadNetworkFetcher()
+        fetcher = get_road_network_fetcher()
         # 1. 주변 도로 네트워크 가져오기 (캐시됨)
-        G = await asyncio.to_thread(
-            fetcher.fetch_pedestrian_network_from_point,
+        G = await fetcher.fetch_pedestrian_network_async(
             center_point=(lat, lng),
             distance=radius
         )
@@ -1350,12 +1322,14 @@ def _generate_gps_art_background(task_id: str):
         db.commit()
     except Exception as e:
         db.rollback()
-        task = db.query(RouteGenerationTask).filter(RouteGenerationTask.id == task_id).first()
-        if task:
-            task.status = "failed"
-            task.error_message = str(e)[:500]
-            task.completed_at = datetime.now()
-            db.commit()
+        # SELECT 없이 UPDATE 한 번으로 실패 처리 (없는 Task면 0행 갱신)
+        db.execute(
+            update(RouteGenerationTask)
+            .where(RouteGenerationTask.id == task_id)
+            .values(status="failed", error_message=str(e)[:500], completed_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
     finally:
         db.close()
     
@@ -1390,15 +1364,18 @@ def get_option_places(
     all_ids = list((place_ids_raw.get("cafe") or []) + (place_ids_raw.get("convenience") or []))
     if not all_ids:
         return {"success": True, "data": {"places": []}}
-    places = db.query(Place).filter(Place.id.in_(all_ids), Place.is_active == True).all()
+    # 응답에 필요한 컬럼만 조회 (Place ORM 객체 생성 생략)
+    places = db.query(
+        Place.id, Place.name, Place.category, Place.latitude, Place.longitude
+    ).filter(Place.id.in_(all_ids), Place.is_active == True).all()
     out = []
-    for p in places:
+    for place_id, name, category, latitude, longitude in places:
         out.append({
-            "id": str(p.id),
-            "name": p.name or "",
-            "category": p.category or "",
-            "lat": float(p.latitude),
-            "lng": float(p.longitude),
+            "id": str(place_id),
+            "name": name or "",
+            "category": category or "",
+            "lat": float(latitude),
+            "lng": float(longitude),
         })
 
     return {"success": True, "data": {"places": out}}
\ No newline at end of file
@@ -6,6 +6,7 @@
 
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -29,6 +30,7 @@ from app.schemas.workout import (
 )
 from app.schemas.route import SavedRouteSchema
 from app.schemas.common import PaginationInfo
+from app.services.workout_service import WORKOUT_LIST_COLUMNS
 
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -254,16 +256,22 @@ def get_my_workouts(
 ):
     """내 운동 기록 조회 엔드포인트"""
     
-    # 기본 쿼리
-    query = db.query(Workout).filter(
+    filters = [
         Workout.user_id == current_user.id,
         Workout.status == "completed",
         Workout.deleted_at.is_(None)
-    )
+    ]
     
     # 모드 필터
     if mode:
-        query = query.filter(Workout.mode == mode)
+        filters.append(Workout.mode == mode)
+    
+    # 기본 쿼리 (ORM 객체 대신 목록 응답에 필요한 컬럼만 Row 튜플로 조회)
+    # COUNT(*) 쿼리를 따로 보내지 않고 윈도우 함수로 전체 개수를 함께 조회 (왕복 1회)
+    query = db.query(
+        *WORKOUT_LIST_COLUMNS,
+        func.count().over().label("total")
+    ).filter(*filters)
     
     # 정렬
     if sort == "distance_desc":
@@ -275,13 +283,19 @@ def get_my_workouts(
     else:  # date_desc (기본값)
         query = query.order_by(Workout.completed_at.desc())
     
-    # 전체 개수
-    total_count = query.count()
-    
     # 페이지네이션
     offset = (page - 1) * limit
     workouts = query.offset(offset).limit(limit).all()
     
+    # 전체 개수
+    if workouts:
+        total_count = workouts[0].total
+    elif offset > 0:
+        # 마지막 페이지를 넘으면 행이 없어 전체 개수를 알 수 없으므로 따로 조회
+        total_count = db.query(func.count(Workout.id)).filter(*filters).scalar()
+    else:
+        total_count = 0
+    
     # 응답 데이터 변환
     # 북마크 여부를 한 번에 조회 (N+1 방지)
     from app.models.route import RouteShape
@@ -387,7 +401,11 @@ def get_my_saved_routes(
     from sqlalchemy.orm import joinedload, selectinload
     
     # joinedload로 Route, RouteShape, RouteOption을 한 번에 로드 (N+1 쿼리 방지)
-    query = db.query(SavedRoute).options(
+    # COUNT(*) 쿼리를 따로 보내지 않고 윈도우 함수로 전체 개수를 함께 조회 (왕복 1회)
+    query = db.query(
+        SavedRoute,
+        func.count().over().label("total")
+    ).options(
         joinedload(SavedRoute.route)
         .joinedload(Route.shape),
         joinedload(SavedRoute.route)
@@ -402,14 +420,21 @@ def get_my_saved_routes(
     else:
         query = query.order_by(SavedRoute.saved_at.desc())
     
-    # 전체 개수 (joinedload 전 count용 별도 쿼리)
-    total_count = db.query(SavedRoute).filter(
-        SavedRoute.user_id == current_user.id
-    ).count()
-    
     # 페이지네이션
     offset = (page - 1) * limit
-    saved_routes = query.offset(offset).limit(limit).all()
+    rows = query.offset(offset).limit(limit).all()
+    saved_routes = [row[0] for row in rows]
+    
+    # 전체 개수
+    if rows:
+        total_count = rows[0].total
+    elif offset > 0:
+        # 마지막 페이지를 넘으면 행이 없어 전체 개수를 알 수 없으므로 따로 조회
+        total_count = db.query(func.count(SavedRoute.id)).filter(
+            SavedRoute.user_id == current_user.id
+        ).scalar()
+    else:
+        total_count = 0
     
     # 작성자 ID 일괄 수집 → 단일 쿼리로 조회
     author_ids = list({sr.route.user_id for sr in saved_routes if sr.route})
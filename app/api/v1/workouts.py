@@ -174,7 +174,7 @@ def pause_workout(
 ):
     """운동 일시정지 엔드포인트"""
     service = WorkoutService(db)
-    workout = service.pause_workout(workout_id, current_user.id)
+    service.pause_workout(workout_id, current_user.id)
     
     return CommonResponse(
         success=True,
@@ -199,7 +199,7 @@ def resume_workout(
 ):
     """운동 재개 엔드포인트"""
     service = WorkoutService(db)
-    workout = service.resume_workout(workout_id, current_user.id)
+    service.resume_workout(workout_id, current_user.id)
     
     return CommonResponse(
         success=True,
@@ -44,6 +44,15 @@ class Settings(BaseSettings):
     # OSMnx 캐시 디렉토리
     OSMNX_CACHE_DIR: str = "cache/osmnx"
     
+    # OSMnx 도로 네트워크 캐시 유지 기간 (일)
+    OSMNX_CACHE_TTL_DAYS: int = 30
+    
+    # 디스크 캐시 앞단의 프로세스 내 도로 네트워크 LRU 캐시 크기 (그래프 개수, 0이면 사용 안 함)
+    OSMNX_MEM_CACHE_SIZE: int = 32
+    
+    # SRTM 고도 타일 캐시 디렉토리 (다운로드한 타일을 재시작 후에도 재사용)
+    SRTM_CACHE_DIR: str = "cache/srtm"
+    
     # --------------------------------------------
     # 데이터베이스 설정
     # --------------------------------------------
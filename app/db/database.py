@@ -5,7 +5,11 @@
 # SQLAlchemy ORM을 사용하여 데이터베이스 작업을 수행합니다.
 # ============================================
 
+import json
+from functools import partial
+
 from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -23,12 +27,15 @@ from app.config import settings
 # - pool_pre_ping: 연결이 유효한지 미리 확인 (끊어진 연결 방지)
 # - pool_recycle: 연결 재사용 시간 (초). MariaDB는 8시간 후 연결 끊김
 # - echo: True로 설정하면 실행되는 SQL을 콘솔에 출력 (디버깅용)
+# - json_serializer: JSON 컬럼 저장 시 사용할 직렬화 함수
+#   (경로 좌표 JSON은 수천 개 점이 될 수 있어 공백 없는 구분자로 저장 크기를 줄임)
 # ============================================
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,      # 연결 상태 확인
     pool_recycle=3600,       # 1시간마다 연결 갱신
-    echo=False               # SQL 로그 비활성화
+    echo=False,              # SQL 로그 비활성화
+    json_serializer=partial(json.dumps, separators=(",", ":")),
 )
 
 
@@ -93,3 +100,18 @@ def get_db() -> Generator[Session, None, None]:
         # API 처리가 끝나면 세션 종료
         # 예외가 발생해도 반드시 실행됩니다
         db.close()
+
+
+# MariaDB/MySQL 중복 키 에러 코드 (ER_DUP_ENTRY)
+_MYSQL_DUP_ENTRY = 1062
+
+
+def is_duplicate_key_error(exc: IntegrityError) -> bool:
+    """
+    IntegrityError가 유니크 제약조건 위반(중복 키)으로 발생했는지 확인합니다.
+    
+    외래 키 위반 등 다른 무결성 에러와 구분할 때 사용합니다.
+    (먼저 SELECT로 확인하고 INSERT하는 대신, INSERT 후 중복 에러를 처리하는 경우)
+    """
+    args = getattr(exc.orig, "args", None)
+    return bool(args) and args[0] == _MYSQL_DUP_ENTRY
@@ -1,18 +1,14 @@
 from typing import List, Dict, Any
-import math, logging
+import logging
+import numpy as np
+from pyproj import Geod
 
 logger = logging.getLogger(__name__)
 
-# 최종 선택된 경로의 좌표만으로 SRTM을 이용해 고도/경사도 메트릭을 계산
+# 기존 하버사인 공식과 동일한 구(반지름 6371km) 기준 측지 계산 (PROJ C 구현 사용)
+_GEOD = Geod(a=6371000.0, b=6371000.0)
 
-def _haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    R = 6371000 # 지구 반지름 (미터)
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlam = math.radians(lon2 - lon1)
-    a = math.sin(dphi/2)**2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam/2)**2
-    c = 2 * math.asin(math.sqrt(a))
-    return R * c
+# 최종 선택된 경로의 좌표만으로 SRTM을 이용해 고도/경사도 메트릭을 계산
 
 def compute_route_elevation_metrics(
     coordinates: List[Dict[str, float]]
@@ -52,31 +48,25 @@ def compute_route_elevation_metrics(
             "max_grade": 0.0,
         }
 
-    total_ascent = 0.0
-    total_descent = 0.0
-    total_elevation_change = 0.0
-    grades = []
+    # 구간 거리를 좌표 배열 단위로 한 번에 계산 (구간마다 파이썬 삼각함수 호출 제거)
+    lats = np.fromiter((lat for lat, _ in coords_tuples), dtype=np.float64, count=len(coords_tuples))
+    lons = np.fromiter((lon for _, lon in coords_tuples), dtype=np.float64, count=len(coords_tuples))
+    _, _, seg_dists = _GEOD.inv(lons[:-1], lats[:-1], lons[1:], lats[1:])
+
+    # 고도 차 / 상승·하강 누적 / 경사도도 구간 루프 없이 배열 연산으로 계산
+    elevs = np.asarray(elevations, dtype=np.float64)
+    diffs = np.diff(elevs)
+    abs_diffs = np.abs(diffs)
+    dists = np.maximum(np.asarray(seg_dists, dtype=np.float64), 0.1)
 
-    for i in range(len(coordinates) - 1):
-        elev_u, elev_v = float(elevations[i]), float(elevations[i + 1])
-        diff = elev_v - elev_u
-        dist = _haversine_meters(
-            coords_tuples[i][0], coords_tuples[i][1],
-            coords_tuples[i + 1][0], coords_tuples[i + 1][1],
-        )
-        if dist < 0.1:
-            dist = 0.1
-        total_elevation_change += abs(diff)
-        if diff > 0:
-            total_ascent += diff
-        else:
-            total_descent += abs(diff)
-        grade_ratio = diff / dist
-        grades.append(abs(grade_ratio) * 100)
+    total_elevation_change = float(abs_diffs.sum())
+    total_ascent = float(diffs[diffs > 0].sum())
+    total_descent = float(abs_diffs[diffs <= 0].sum())
+    grades = abs_diffs / dists * 100
 
-    max_elev_diff = max(elevations) - min(elevations) if elevations else 0
-    avg_grade = (sum(grades) / len(grades)) if grades else 0.0
-    max_grade = max(grades) if grades else 0.0
+    max_elev_diff = float(elevs.max() - elevs.min())
+    avg_grade = float(grades.mean())
+    max_grade = float(grades.max())
     
     return {
         "max_elevation_diff": int(round(max_elev_diff)),
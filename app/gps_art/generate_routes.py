@@ -3,6 +3,7 @@ from .road_network import RoadNetworkFetcher
 from .gps_art_router import GPSArtRouter
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from .elevation_metrics import compute_route_elevation_metrics
+import heapq
 import os
 
 # 프론트에서 보내줄 그림 포인트 형식:
@@ -239,8 +240,8 @@ def generate_routes(
                 on_progress(85, "processing")
                 
         # 각도별 1등을 유사도로 정렬 후 상위 3개를 최종 routes로
-        all_candidates.sort(key=lambda x: x[2]["similarity_score"])
-        top3 = all_candidates[:3]
+        # 전체 정렬 대신 상위 3개만 힙으로 선택 (O(N log 3))
+        top3 = heapq.nsmallest(3, all_candidates, key=lambda x: x[2]["similarity_score"])
         best_routes = [item[2] for item in top3]
         for i, r in enumerate(best_routes, start=1):
             r["id"] = i
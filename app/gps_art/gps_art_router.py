@@ -1,6 +1,6 @@
 from queue import PriorityQueue
 from typing import List, Tuple, Dict, Optional
-from .road_network import haversine_distance, RoadNetworkFetcher, haversine_matrix_meters
+from .road_network import haversine_distance, RoadNetworkFetcher, haversine_matrix_meters, haversine_pairwise_meters, haversine_polyline_meters
 from collections import defaultdict
 import networkx as nx
 import numpy as np
@@ -45,17 +45,7 @@ class GPSArtRouter:
         """
         if not hasattr(self, "_node_grid") or self._node_grid is None:
             # 그리드 없으면 전체 스캔으로 (node_id, 거리m) 리스트 반환
-            lon, lat = point[0], point[1]
-            result: List[Tuple[int, float]] = []
-            for node_id in self.G.nodes():
-                pos = self.G.nodes[node_id].get("pos")
-                if pos is None:
-                    continue
-                n_lon, n_lat = pos[0], pos[1]
-                d = haversine_distance((lon, lat), (n_lon, n_lat))
-                if d <= radius_m:
-                    result.append((node_id, d))
-            return result
+            return self._nodes_within_radius(self.G.nodes(), point, radius_m)
         lon, lat = point[0], point[1]
         # 반경(미터)를 대략 경도/위도 차이로. 간단히 1도≈111km
         r_deg = radius_m / 111_000.0
@@ -65,19 +55,38 @@ class GPSArtRouter:
         ci_max = int((lat + r_deg) // cell_size)
         cj_min = int((lon - r_deg) // cell_size)
         cj_max = int((lon + r_deg) // cell_size)
-        result: List[Tuple[int, float]] = []
+        cell_nodes: List[int] = []
         for ci in range(ci_min, ci_max + 1):
             for cj in range(cj_min, cj_max + 1):
-                for node_id in self._node_grid.get((ci, cj), []):
-                    pos = self.G.nodes[node_id].get("pos")
-                    if pos is None:
-                        continue
-                    n_lon, n_lat = pos[0], pos[1]
-                    d = haversine_distance((lon, lat), (n_lon, n_lat))
-                    if d <= radius_m:
-                        result.append((node_id, d))
+                cell_nodes.extend(self._node_grid.get((ci, cj), []))
+
+        return self._nodes_within_radius(cell_nodes, point, radius_m)
 
-        return result
+    def _nodes_within_radius(
+        self, node_ids, point: Tuple[float, float], radius_m: float
+    ) -> List[Tuple[int, float]]:
+        """
+        후보 노드들 중 점에서 radius_m 이내인 노드를 (node_id, 거리m) 리스트로 반환.
+        노드마다 haversine_distance를 호출하는 대신 후보 전체를 한 번에 벡터 연산.
+        """
+        ids: List[int] = []
+        n_lons: List[float] = []
+        n_lats: List[float] = []
+        for node_id in node_ids:
+            pos = self.G.nodes[node_id].get("pos")
+            if pos is None:
+                continue
+            ids.append(node_id)
+            n_lons.append(pos[0])
+            n_lats.append(pos[1])
+        if not ids:
+            return []
+
+        dists = haversine_pairwise_meters(
+            np.float64(point[0]), np.float64(point[1]),
+            np.asarray(n_lons, dtype=np.float64), np.asarray(n_lats, dtype=np.float64),
+        )
+        return [(ids[i], float(dists[i])) for i in np.flatnonzero(dists <= radius_m)]
 
     # 주어진 좌표(lon, lat)에 가장 가까운 그래프 노드 찾기. 그리드 있으면 근처 셀만 검사.
     def find_nearest_node(self, point: [LonLat], search_radius_m: float = 500.0) -> int:
@@ -135,9 +144,7 @@ class GPSArtRouter:
         if len(points) < 2:
             return list(points)
 
-        seg_lengths = []
-        for i in range(len(points) - 1):
-            seg_lengths.append(haversine_distance(points[i], points[i + 1]))
+        seg_lengths = haversine_polyline_meters(points).tolist()
 
         total_len = sum(seg_lengths)
         if total_len <= 0:
@@ -754,12 +761,7 @@ class GPSArtRouter:
             스케일링된 좌표 리스트
         """
         # 현재 그림의 거리 계산
-        current_distance = 0.0
-        for i  in range(len(drawing_coordinates) - 1):
-            current_distance += haversine_distance(
-                drawing_coordinates[i],
-                drawing_coordinates[i + 1],
-            )
+        current_distance = float(haversine_polyline_meters(drawing_coordinates).sum())
 
         if current_distance < 1e-6:
             return drawing_coordinates
@@ -1,8 +1,89 @@
-from typing import Dict, List, Any
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from sqlalchemy import cast, func, Float
 from sqlalchemy.orm import Session
 
 from app.models.route import Place
-from .road_network import haversine_distance
+from .road_network import haversine_matrix_meters
+
+# 동일 경로(좌표)에 대한 반복 조회를 줄이기 위한 프로세스 내 TTL 캐시
+# 키: (반올림 좌표 튜플, radius_m) / 좌표는 소수 4자리(약 11m)로 반올림
+_PLACES_CACHE_TTL_SEC = 300
+_PLACES_CACHE_MAXSIZE = 512
+_PLACES_CACHE_PRECISION = 4
+
+_places_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, List[str]]]]" = OrderedDict()
+_places_cache_lock = threading.Lock()
+
+# (장소 N x 경로 좌표 M) 거리 행렬을 한 번에 만들면 메모리가 커지므로 장소를 나눠서 계산
+_DIST_CHUNK_SIZE = 2048
+
+# 후보 행을 한 번에 모두 적재하지 않고 나눠서 스트리밍
+_QUERY_YIELD_PER = 1000
+
+# 위도 1도당 거리 (m) - 거리 판정에 쓰는 haversine과 같은 지구 반지름(6371000m) 기준
+_METERS_PER_DEG_LAT = 6371000.0 * math.pi / 180
+
+# bbox 여유 비율 (부동소수점 오차, 고위도에서 대권 거리와 위도선 거리 차이로 경계의 장소가 빠지지 않도록)
+_BBOX_MARGIN_SLACK = 1.01
+
+
+def _make_cache_key(coordinates: List[Dict[str, float]], radius_m: float) -> Optional[Tuple]:
+    try:
+        coords_key = tuple(
+            (round(float(c.get("lat", 0)), _PLACES_CACHE_PRECISION),
+             round(float(c.get("lng", 0)), _PLACES_CACHE_PRECISION))
+            for c in coordinates
+        )
+    except (TypeError, ValueError, AttributeError):
+        return None
+    return (coords_key, float(radius_m))
+
+
+def _copy_result(result: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    # 호출 측에서 리스트를 수정해도 캐시가 오염되지 않도록 복사본 반환
+    return {k: list(v) for k, v in result.items()}
+
+
+def clear_places_cache() -> None:
+    """Place 데이터 변경 시 호출하여 캐시를 비웁니다."""
+    with _places_cache_lock:
+        _places_cache.clear()
+
+
+def _expanded_bbox(
+    lats: List[float], lngs: List[float], radius_m: float,
+) -> Tuple[float, float, float, float]:
+    """경로 좌표의 bbox를 radius_m 만큼 확장 (min_lat, max_lat, min_lng, max_lng)"""
+    min_lat, max_lat = min(lats), max(lats)
+    min_lng, max_lng = min(lngs), max(lngs)
+    margin_m = radius_m * _BBOX_MARGIN_SLACK
+    lat_margin = margin_m / _METERS_PER_DEG_LAT
+    # 경도 1도 거리는 고위도일수록 짧아지므로 절댓값이 큰 위도를 기준으로 여유 있게 잡음
+    cos_lat = max(math.cos(math.radians(max(abs(min_lat), abs(max_lat)))), 1e-6)
+    lng_margin = margin_m / (_METERS_PER_DEG_LAT * cos_lat)
+    return min_lat - lat_margin, max_lat + lat_margin, min_lng - lng_margin, max_lng + lng_margin
+
+
+def _min_distances_to_path(
+    place_lngs: np.ndarray, place_lats: np.ndarray,
+    path_lngs: np.ndarray, path_lats: np.ndarray,
+) -> np.ndarray:
+    """
+    각 장소에서 경로 좌표까지의 최소 거리(m) 배열 (N,)
+    장소 x 좌표 이중 for문 대신 청크 단위 하버사인 행렬로 계산
+    """
+    min_dists = np.empty(place_lngs.shape[0], dtype=np.float64)
+    for start in range(0, place_lngs.shape[0], _DIST_CHUNK_SIZE):
+        stop = start + _DIST_CHUNK_SIZE
+        dists = haversine_matrix_meters(place_lngs[start:stop], place_lats[start:stop], path_lngs, path_lats)
+        min_dists[start:stop] = dists.min(axis=1)
+    return min_dists
+
 
 # 경로 좌표 기준 반경 500m 이내 places 조회 (cafe /convenience)
 def get_places_ids(
@@ -17,29 +98,78 @@ def get_places_ids(
     if not coordinates:
         return result
 
-    places = db.query(Place).filter(Place.is_active == True).all()
-    for place in places:
+    cache_key = _make_cache_key(coordinates, radius_m)
+    if cache_key is not None:
+        now = time.monotonic()
+        with _places_cache_lock:
+            cached = _places_cache.get(cache_key)
+            if cached is not None:
+                expires_at, cached_result = cached
+                if expires_at > now:
+                    _places_cache.move_to_end(cache_key)
+                    return _copy_result(cached_result)
+                del _places_cache[cache_key]
+
+    path_lats: List[float] = []
+    path_lngs: List[float] = []
+    for c in coordinates:
         try:
-            lat = float(place.latitude)
-            lon = float(place.longitude)
+            clat = float(c.get("lat", 0))
+            clng = float(c.get("lng", 0))
         except (TypeError, ValueError):
             continue
-        place_pos = (lon, lat)
-        min_dist = float('inf')
-        for c in coordinates:
-            try:
-                clat = float(c.get("lat", 0))
-                clng = float(c.get("lng", 0))
-            except (TypeError, ValueError):
-                continue
-            d = haversine_distance(place_pos, (clng, clat))
-            if d < min_dist:
-                min_dist = d
-        if min_dist > radius_m:
+        path_lats.append(clat)
+        path_lngs.append(clng)
+    if not path_lats:
+        return result
+
+    # 경로 bbox를 반경만큼 확장해 DB에서 후보를 먼저 거름
+    min_lat, max_lat, min_lng, max_lng = _expanded_bbox(path_lats, path_lngs, radius_m)
+
+    # ORM 객체 전체 대신 필터링에 필요한 컬럼만 튜플로 조회
+    # DECIMAL 좌표는 DB에서 float로 캐스팅해 행마다 Decimal -> float 변환을 피함
+    rows = db.query(
+        Place.id, Place.category,
+        cast(Place.latitude, Float).label("lat"),
+        cast(Place.longitude, Float).label("lng"),
+    ).filter(
+        Place.is_active == True,
+        # 카테고리 값에 대소문자/공백이 섞여 있어도 아래 분류와 같은 기준으로 거름
+        func.lower(func.trim(Place.category)).in_(("cafe", "convenience")),
+        Place.latitude.between(min_lat, max_lat),
+        Place.longitude.between(min_lng, max_lng),
+    ).yield_per(_QUERY_YIELD_PER)
+    valid_places = []
+    place_lats: List[float] = []
+    place_lngs: List[float] = []
+    for place_id, category, latitude, longitude in rows:
+        try:
+            lat = float(latitude)
+            lon = float(longitude)
+        except (TypeError, ValueError):
             continue
-        cat = (place.category or "").strip().lower()
-        if cat == "cafe" and str(place.id) not in result["cafe"]:
-            result["cafe"].append(str(place.id))
-        elif cat == "convenience" and str(place.id) not in result["convenience"]:
-            result["convenience"].append(str(place.id))
+        valid_places.append((str(place_id), (category or "").strip().lower()))
+        place_lats.append(lat)
+        place_lngs.append(lon)
+
+    if valid_places:
+        min_dists = _min_distances_to_path(
+            np.asarray(place_lngs, dtype=np.float64),
+            np.asarray(place_lats, dtype=np.float64),
+            np.asarray(path_lngs, dtype=np.float64),
+            np.asarray(path_lats, dtype=np.float64),
+        )
+        for idx in np.flatnonzero(min_dists <= radius_m):
+            place_id, cat = valid_places[idx]
+            if cat == "cafe" and place_id not in result["cafe"]:
+                result["cafe"].append(place_id)
+            elif cat == "convenience" and place_id not in result["convenience"]:
+                result["convenience"].append(place_id)
+
+    if cache_key is not None:
+        with _places_cache_lock:
+            _places_cache[cache_key] = (time.monotonic() + _PLACES_CACHE_TTL_SEC, _copy_result(result))
+            _places_cache.move_to_end(cache_key)
+            while len(_places_cache) > _PLACES_CACHE_MAXSIZE:
+                _places_cache.popitem(last=False)
     return result
@@ -16,7 +16,11 @@ class RoadNetworkFetcher:
         # OSMnx 설정
         ox.settings.use_cache = True
         ox.settings.log_console = True
-        ox.settings.timeout = timeout
+        # OSMnx 2.x는 requests_timeout, 1.x 이전 버전은 timeout 설정을 사용
+        if hasattr(ox.settings, 'requests_timeout'):
+            ox.settings.requests_timeout = timeout
+        else:
+            ox.settings.timeout = timeout
         base = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
         ox.settings.cache_folder = os.path.join(base, 'cache')
         self.timeout = timeout
@@ -127,17 +131,17 @@ class RoadNetworkFetcher:
             무방향 Graph (모든 노드에 pos 속성 포함)
         """
         # MultiDiGraph -> 무방향 Graph 변환
-        G_undirected = G.to_undirected()
+        # to_undirected()는 노드/엣지 속성(geometry 등)을 모두 deepcopy하므로,
+        # 무방향 뷰를 만든 뒤 속성 dict만 얕게 복사해 구체화 (이후 pos 추가/노드 삭제를 위해 복사는 필요)
+        G_undirected = G.to_undirected(as_view=True).copy()
 
         # 모든 노드에 pos 속성 추가 (gps_art_router.py 호환성)
         # OSMnx는 노드에 'x'(경도), 'y'(위도) 속성을 가지고 있음
+        # (lat/lon 중복 속성은 읽는 곳이 없어 기록하지 않음, 경로 계산은 build_pos_arrays의 배열 사용)
         for node_id, data in G_undirected.nodes(data=True):
             if 'x' in data and 'y' in data:
                 # pos는 (lon, lat) 형식
                 data['pos'] = (data['x'], data['y'])
-                # lat, lon도 별도로 유지 (호환성)
-                data['lon'] = data['x']
-                data['lat'] = data['y']
             else:
                 logger.warning(f"Node {node_id} missing x/y coordinates")
 
@@ -148,6 +152,9 @@ class RoadNetworkFetcher:
             logger.info(f"Removing {len(isolated)} isolated nodes")
             G_undirected.remove_nodes_from(isolated)
 
+        # 경로 거리/좌표 변환에서 노드 dict를 매번 조회하지 않도록 좌표 배열을 미리 만들어 둠
+        build_pos_arrays(G_undirected)
+
         return G_undirected
 
     # 경로의 총 거리를 계산
@@ -167,36 +174,45 @@ class RoadNetworkFetcher:
         if len(path) < 2:
             return 0.0
 
-        total_distance = 0.0
-
-        for i in range(len(path) - 1):
-            node1 = path[i]
-            node2 = path[i + 1]
-
-            if not graph.has_edge(node1, node2):
+        # 구간별 길이 배열: 엣지 length/weight가 있으면 그대로 쓰고,
+        # 없는 구간은 모아 두었다가 하버사인을 한 번에 벡터 계산
+        edge_lens = np.zeros(len(path) - 1, dtype=np.float64)
+        missing: List[int] = [] # 하버사인으로 채울 구간 인덱스
+        no_edge: List[int] = [] # 그중 직접 연결이 없는 구간 (좌표 누락 경고용)
+
+        # has_edge + get_edge_data로 인접 dict를 두 번 조회하지 않고 한 번만 조회
+        adj = graph._adj
+        for i, (node1, node2) in enumerate(zip(path, path[1:])):
+            edge_data = adj[node1].get(node2)
+            if edge_data is None:
                 # 직접 연결이 없으면 Haversine 거리 계산
-                pos1 = graph.nodes[node1].get('pos')
-                pos2 = graph.nodes[node2].get('pos')
-
-                if pos1 and pos2:
-                    total_distance += haversine_distance(pos1, pos2)
-                else:
-                    logger.warning(f"Edge ({node1}, {node2}) not found and no pos data")
+                missing.append(i)
+                no_edge.append(i)
             else:
                 # 엣지의 length 속성 사용 (OSMnx가 계산한 실제 거리)
-                edge_data = graph.get_edge_data(node1, node2)
                 if 'length' in edge_data:
-                    total_distance += edge_data['length']
+                    edge_lens[i] = edge_data['length']
                 elif 'weight' in edge_data:
-                    total_distance += edge_data['weight']
+                    edge_lens[i] = edge_data['weight']
                 else:
                     # length/weight가 없으면 Haversine 거리 계산
-                    pos1 = graph.nodes[node1].get('pos')
-                    pos2 = graph.nodes[node2].get('pos')
-                    if pos1 and pos2:
-                        total_distance += haversine_distance(pos1, pos2)
-
-        return total_distance
+                    missing.append(i)
+
+        if missing:
+            # 캐시된 좌표 배열에서 구간 양 끝 노드 좌표를 한 번에 슬라이싱 (pos가 없으면 NaN)
+            lons, lats, _ = path_pos_arrays(graph, path)
+            seg = np.asarray(missing, dtype=np.int64)
+            dists = haversine_pairwise_meters(lons[seg], lats[seg], lons[seg + 1], lats[seg + 1])
+            no_pos = np.isnan(dists)
+            if no_pos.any():
+                no_edge_set = set(no_edge)
+                for row in np.flatnonzero(no_pos).tolist():
+                    i = missing[row]
+                    if i in no_edge_set:
+                        logger.warning(f"Edge ({path[i]}, {path[i + 1]}) not found and no pos data")
+            edge_lens[missing] = np.where(no_pos, 0.0, dists)
+
+        return float(edge_lens.sum())
 
     # 경로를 카카오 지도 좌표 형식으로 변환
     def path_to_kakao_coordinates(
@@ -212,22 +228,20 @@ class RoadNetworkFetcher:
         Returns:
             [{'lat': y, "lng": x}, ...] 형식의 리스트
         """
-        coordinates = []
-
-        for node_id in path:
-            node_data = graph.nodes[node_id]
-
-            # _postprocess_graph에서 이미 pos 속성을 추가했으므로 pos만 체크
-            if 'pos' in node_data:
-                lon, lat = node_data['pos']
-                coordinates.append({
-                    'lat': lat,
-                    "lng": lon
-                })
-            else:
-                logger.warning(f"Node {node_id} missing pos coordinate data")
-
-        return coordinates
+        # 노드별 dict 조회 대신 캐시된 좌표 배열을 경로 인덱스로 한 번에 슬라이싱
+        # (_postprocess_graph에서 pos 속성으로 만든 배열, pos가 없으면 NaN)
+        lons, lats, _ = path_pos_arrays(graph, path)
+        valid = ~(np.isnan(lons) | np.isnan(lats))
+        if not valid.all():
+            for i in np.flatnonzero(~valid).tolist():
+                logger.warning(f"Node {path[i]} missing pos coordinate data")
+            lons = lons[valid]
+            lats = lats[valid]
+
+        return [
+            {'lat': lat, "lng": lon}
+            for lat, lon in zip(lats.tolist(), lons.tolist())
+        ]
  
     # 경로의 상세 정보를 반환
     def get_path_info(
@@ -276,14 +290,8 @@ class RoadNetworkFetcher:
         if len(drawing_coordinates) < 2:
             return 0.0
         
-        total_distance = 0.0
-        
-        for i in range(len(drawing_coordinates) - 1):
-            pos1 = drawing_coordinates[i]
-            pos2 = drawing_coordinates[i + 1]
-            total_distance += haversine_distance(pos1, pos2)
-        
-        return total_distance
+        # 구간별 거리를 배열 연산으로 한 번에 계산
+        return float(haversine_polyline_meters(drawing_coordinates).sum())
 
     # 사용자가 입력한 거리와 최소 거리를 비교하여 검증합니다.
     def validate_target_distance(
@@ -430,6 +438,46 @@ class RoadNetworkFetcher:
 
         return G
 
+def build_pos_arrays(G: nx.Graph) -> Tuple[np.ndarray, np.ndarray, Dict[int, int]]:
+    """
+    노드 pos 속성으로 경도/위도 배열과 노드 ID -> 행 인덱스 맵을 만들어 G.graph에 저장한다.
+    pos가 없는 노드는 NaN
+
+    Returns:
+        (lons, lats, node_index)
+    """
+    node_ids = list(G.nodes())
+    lons = np.full(len(node_ids), np.nan)
+    lats = np.full(len(node_ids), np.nan)
+    for i, (_, pos) in enumerate(G.nodes(data='pos')):
+        if pos:
+            lons[i], lats[i] = pos
+    node_index = {n: i for i, n in enumerate(node_ids)}
+
+    G.graph['_lons'] = lons
+    G.graph['_lats'] = lats
+    G.graph['_node_index'] = node_index
+    return lons, lats, node_index
+
+
+def path_pos_arrays(G: nx.Graph, path: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    경로 노드의 (경도 배열, 위도 배열, 행 인덱스 배열)을 반환한다.
+    캐시된 좌표 배열이 없거나 경로에 배열에 없는 노드가 있으면(그래프 변경 등) 다시 만든다.
+    """
+    node_index = G.graph.get('_node_index')
+    lons = G.graph.get('_lons')
+    lats = G.graph.get('_lats')
+    try:
+        if node_index is None or lons is None or lats is None:
+            raise KeyError
+        path_idx = np.fromiter((node_index[n] for n in path), dtype=np.int64, count=len(path))
+    except KeyError:
+        lons, lats, node_index = build_pos_arrays(G)
+        path_idx = np.fromiter((node_index[n] for n in path), dtype=np.int64, count=len(path))
+    return lons[path_idx], lats[path_idx], path_idx
+
+
 # 구 위에 두 지점 사이의 최단 거리(대권 거리, Great-circle distance)를 구하는 공식 (미터 단위)
 def haversine_distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
     """
@@ -484,4 +532,55 @@ def haversine_matrix_meters(
     c = 2.0 * np.arcsin(np.sqrt(a))
     r = 6371000.0
 
-    return r * c
\ No newline at end of file
+    return r * c
+
+
+def haversine_pairwise_meters(
+    lon1: np.ndarray, lat1: np.ndarray,
+    lon2: np.ndarray, lat2: np.ndarray,
+) -> np.ndarray:
+    """
+    (N,) vs (N,) -> (N,) 원소별 하버 사인 거리 (미터 단위).
+    haversine_distance를 좌표쌍마다 호출하는 대신 NumPy 배열 연산으로 한 번에 계산.
+
+    반환값: shape (N,), [i] = (lon1[i], lat1[i]) ~ (lon2[i], lat2[i]) 거리(m)
+    """
+    lon1_rad = np.deg2rad(lon1)
+    lat1_rad = np.deg2rad(lat1)
+    lon2_rad = np.deg2rad(lon2)
+    lat2_rad = np.deg2rad(lat2)
+
+    dlon = lon2_rad - lon1_rad
+    dlat = lat2_rad - lat1_rad
+
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2.0) ** 2
+    a = np.clip(a, 0.0, 1.0)
+    c = 2.0 * np.arcsin(np.sqrt(a))
+    r = 6371000.0
+
+    return r * c
+
+
+def haversine_polyline_meters(points: List[Tuple[float, float]]) -> np.ndarray:
+    """
+    polyline [(lon, lat), ...]의 연속된 두 점 사이 하버 사인 거리 (미터 단위).
+    haversine_distance를 구간마다 호출하는 대신 NumPy 배열 연산으로 한 번에 계산.
+
+    반환값: shape (N-1,), [i] = points[i] ~ points[i+1] 거리(m)
+    """
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if coords.shape[0] < 2:
+        return np.zeros(0, dtype=np.float64)
+
+    lon_rad = np.deg2rad(coords[:, 0])
+    lat_rad = np.deg2rad(coords[:, 1])
+
+    dlon = np.diff(lon_rad)
+    dlat = np.diff(lat_rad)
+
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat_rad[:-1]) * np.cos(lat_rad[1:]) * np.sin(dlon / 2.0) ** 2
+    a = np.clip(a, 0.0, 1.0)
+    c = 2.0 * np.arcsin(np.sqrt(a))
+    r = 6371000.0
+
+    return r * c
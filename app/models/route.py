@@ -228,6 +228,11 @@ class Place(Base):
     """
     __tablename__ = "places"
     
+    __table_args__ = (
+        # 활성 장소를 카테고리/좌표 범위로 조회할 때 사용
+        Index('idx_places_active_category_lat_lng', 'is_active', 'category', 'latitude', 'longitude'),
+    )
+    
     id = Column(String(36), primary_key=True, default=generate_uuid, comment='UUID')
     
     name = Column(String(100), nullable=False, comment='장소 이름')
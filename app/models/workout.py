@@ -8,7 +8,7 @@ import uuid
 from datetime import datetime
 from sqlalchemy import (
     Column, String, Boolean, Integer, Text, DateTime,
-    ForeignKey, DECIMAL, JSON
+    ForeignKey, DECIMAL, JSON, Index
 )
 from sqlalchemy.orm import relationship
 
@@ -34,6 +34,13 @@ class Workout(Base):
     """
     __tablename__ = "workouts"
     
+    __table_args__ = (
+        # 진행 중인 운동 / 단건 조회 (user_id, status, deleted_at 필터)
+        Index('idx_workouts_user_status_deleted', 'user_id', 'status', 'deleted_at'),
+        # 완료된 운동 목록을 완료 시간순으로 조회
+        Index('idx_workouts_user_status_completed', 'user_id', 'status', 'completed_at'),
+    )
+    
     id = Column(String(36), primary_key=True, default=generate_uuid, comment='UUID, workout_id로 사용')
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False, comment='사용자 ID')
     
@@ -97,6 +104,11 @@ class WorkoutSplit(Base):
     """
     __tablename__ = "workout_splits"
     
+    __table_args__ = (
+        # 운동별 구간 기록을 km 순으로 조회
+        Index('idx_workout_splits_workout_km', 'workout_id', 'km'),
+    )
+    
     id = Column(String(36), primary_key=True, default=generate_uuid, comment='UUID')
     workout_id = Column(String(36), ForeignKey("workouts.id"), nullable=False, comment='운동 ID')
     
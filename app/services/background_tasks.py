@@ -7,10 +7,11 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.models.route import RouteGenerationTask, Route, RouteOption
-from app.services.road_network import RoadNetworkFetcher
+from app.services.road_network import get_road_network_fetcher
 from app.utils.geometry import has_self_intersection
 from app.utils.route_helpers import (
     calculate_turn_count,
@@ -22,6 +23,17 @@ from app.utils.route_helpers import (
 logger = logging.getLogger(__name__)
 
 
+def _update_task(db: Session, task_id: str, **values: Any) -> None:
+    """Task를 먼저 SELECT하지 않고 UPDATE 한 번으로 변경 후 커밋 (없는 Task면 0행 갱신)"""
+    db.execute(
+        update(RouteGenerationTask)
+        .where(RouteGenerationTask.id == task_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
 def update_task_progress(
     db: Session,
     task_id: str,
@@ -30,18 +42,16 @@ def update_task_progress(
     estimated_remaining: int = None
 ):
     """Task 진행률 업데이트"""
-    task = db.query(RouteGenerationTask).filter(
-        RouteGenerationTask.id == task_id
-    ).first()
+    values: Dict[str, Any] = {
+        "progress": progress,
+        "current_step": current_step,
+        "status": "processing",  # 진행 중으로 변경
+    }
+    if estimated_remaining is not None:
+        values["estimated_remaining"] = estimated_remaining
     
-    if task:
-        task.progress = progress
-        task.current_step = current_step
-        task.status = "processing"  # 진행 중으로 변경
-        if estimated_remaining is not None:
-            task.estimated_remaining = estimated_remaining
-        db.commit()
-        logger.info(f"Task {task_id}: {progress}% - {current_step}")
+    _update_task(db, task_id, **values)
+    logger.info(f"Task {task_id}: {progress}% - {current_step}")
 
 
 def run_generate_route_background(task_id: str, user_id: str, request_data: Dict[str, Any]):
@@ -128,11 +138,10 @@ async def generate_route_background(
             
         print(f"🛣️ Fetching road network for Task {task_id} (radius: {radius_meter}m)...")
         
-        fetcher = RoadNetworkFetcher()
+        fetcher = get_road_network_fetcher()
         
-        # Blocking Call을 쓰레드풀로 이관하여 이벤트 루프 차단 방지
-        G = await asyncio.to_thread(
-            fetcher.fetch_pedestrian_network_from_point,
+        # Blocking Call을 쓰레드풀로 이관하여 이벤트 루프 차단 방지 (같은 지역 동시 요청은 병합)
+        G = await fetcher.fetch_pedestrian_network_async(
             (lat, lng),
             radius_meter
         )
@@ -142,7 +151,13 @@ async def generate_route_background(
         update_task_progress(db, task_id, 30, "고도 데이터 가져오는 중...", 20)
         print(f"⛰️ Fetching elevation data for Task {task_id}...")
         
-        await asyncio.to_thread(fetcher.add_elevation_to_nodes, G)
+        start_node = fetcher.get_nearest_node(G, (lat, lng))
+        
+        # 루프 경로 위 노드는 출발지에서 도로 거리로 목표 거리 이내이므로 그 범위만 조회
+        await asyncio.to_thread(
+            fetcher.add_elevation_to_nodes, G,
+            origin=start_node, max_distance=target_dist_km * 1000
+        )
         
         # CPU 연산이 많은 작업도 쓰레드풀로 이관
         print(f"📐 Calculating grades for Task {task_id}...")
@@ -159,7 +174,6 @@ async def generate_route_background(
             {"name": "업다운 경로", "weight": "weight_hard",  "tag": None},
         ]
         
-        start_node = fetcher.get_nearest_node(G, (lat, lng))
         generated_routes = []
         
         logger.info(f"Task {task_id}: Generating 3 routes with different weights...")
@@ -267,9 +281,11 @@ async def generate_route_background(
             status="active"
         )
         db.add(route)
+        # 커밋 없이 INSERT만 보내 route.id 확보 (경로/옵션/Task 완료 상태를 한 트랜잭션으로 커밋)
         db.flush()
         
         # RouteOption 저장
+        options = []
         for idx, route_data in enumerate(generated_routes):
             
             option = RouteOption(
@@ -295,25 +311,21 @@ async def generate_route_background(
                 segment_count=len(route_data['coords']) - 1,
                 turn_count=calculate_turn_count(route_data['coords'])
             )
-            db.add(option)
-        
-        db.commit()
-        
-        # 100% - 완료
-        task = db.query(RouteGenerationTask).filter(
-            RouteGenerationTask.id == task_id
-        ).first()
-        
-        if task:
-            task.status = "completed"
-            task.progress = 100
-            task.current_step = "완료!"
-            task.estimated_remaining = 0
-            task.route_id = route.id
-            task.total_candidates = len(generated_routes)
-            task.filtered_by_intersection = 0
-            task.completed_at = datetime.utcnow()
-            db.commit()
+            options.append(option)
+        db.add_all(options)
+        
+        # 100% - 완료 (UPDATE 전에 경로/옵션이 autoflush되고 함께 커밋됨)
+        _update_task(
+            db, task_id,
+            status="completed",
+            progress=100,
+            current_step="완료!",
+            estimated_remaining=0,
+            route_id=route.id,
+            total_candidates=len(generated_routes),
+            filtered_by_intersection=0,
+            completed_at=datetime.utcnow(),
+        )
         
         logger.info(f"✅ Task {task_id} completed successfully")
         
@@ -321,12 +333,9 @@ async def generate_route_background(
         logger.error(f"❌ Task {task_id} failed: {e}", exc_info=True)
         
         # 실패 처리
-        task = db.query(RouteGenerationTask).filter(
-            RouteGenerationTask.id == task_id
-        ).first()
-        
-        if task:
-            task.status = "failed"
-            task.error_message = str(e)
-            task.completed_at = datetime.utcnow()
-            db.commit()
+        _update_task(
+            db, task_id,
+            status="failed",
+            error_message=str(e),
+            completed_at=datetime.utcnow(),
+        )
@@ -15,13 +15,22 @@ logger = logging.getLogger(__name__)
 # SRTM 데이터 (모듈 레벨에서 1회만 초기화, 이후 재사용)
 _srtm_data = None
 
+# 배치 조회 시 중복 좌표 판단용 반올림 자릿수
+_DEDUP_PRECISION = 5
+
 def _get_srtm_data():
     """SRTM 데이터를 싱글턴으로 로드"""
     global _srtm_data
     if _srtm_data is None:
         try:
+            import os
             import srtm
-            _srtm_data = srtm.get_data()
+            from app.config import settings
+
+            # 타일을 프로젝트 캐시 디렉토리에 보관해 같은 지역의 타일을 다시 받지 않도록 함
+            cache_dir = os.path.abspath(settings.SRTM_CACHE_DIR)
+            os.makedirs(cache_dir, exist_ok=True)
+            _srtm_data = srtm.get_data(local_cache_dir=cache_dir)
             logger.info("✅ SRTM 데이터 초기화 완료")
         except Exception as e:
             logger.error(f"❌ SRTM 초기화 실패: {e}")
@@ -74,13 +83,25 @@ class ElevationService:
         results = {}
         success_count = 0
         
+        # 소수 5자리(약 1m)로 반올림한 좌표가 같으면 한 번만 조회 (SRTM 격자 30m보다 충분히 작음)
+        # 루프 경로의 시작/끝점이나 인접 노드처럼 겹치는 좌표의 중복 조회 제거
+        unique_elevations: Dict[Tuple[float, float], Optional[float]] = {}
         for lat, lon in coordinates:
-            elev = self.get_elevation(lat, lon)
+            key = (round(lat, _DEDUP_PRECISION), round(lon, _DEDUP_PRECISION))
+            if key in unique_elevations:
+                elev = unique_elevations[key]
+            else:
+                elev = self.get_elevation(lat, lon)
+                unique_elevations[key] = elev
+                if elev is not None:
+                    success_count += 1
             if elev is not None:
                 results[(lat, lon)] = elev
-                success_count += 1
         
         if coordinates:
-            logger.info(f"⛰️ SRTM 배치 조회: {success_count}/{len(coordinates)}개 성공")
+            logger.info(
+                f"⛰️ SRTM 배치 조회: {success_count}/{len(unique_elevations)}개 성공 "
+                f"(요청 좌표 {len(coordinates)}개)"
+            )
         
         return results
@@ -7,7 +7,7 @@ from app.core.exceptions import ValidationException
 from app.gps_art.generate_routes import generate_routes
 from app.models.route import Route, RouteOption, RouteShape, SavedRoute
 from app.models.workout import Workout
-from app.utils.safety_score import calculate_safety_score
+from app.utils.safety_score import calculate_safety_score, load_infra_points
 from app.gps_art.nearby_places import get_places_ids
 
 
@@ -209,6 +209,9 @@ def generate_gps_art_impl(
             return "도전"
         return base
 
+    # 안전점수용 CCTV/가로등 좌표는 옵션마다 다시 읽지 않고 한 번만 조회
+    infra_points = load_infra_points(db)
+
     for i, r in enumerate(result["routes"]):
         coords = r.get("coordinates", [])
         distance_km = float(r.get("distance_km", 0))
@@ -217,7 +220,7 @@ def generate_gps_art_impl(
         avg_grade = float(m.get("average_grade", 0) or 0)
         difficulty = _difficulty_from_elevation_metrics(total_elev, avg_grade)
         # 안전점수 계산 (DB의 cctvs, lights 테이블 기반)
-        safety = calculate_safety_score(coords, db)
+        safety = calculate_safety_score(coords, db, infra_points=infra_points)
         place_ids = get_places_ids(db, coords)
 
         opt = RouteOption(
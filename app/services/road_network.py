@@ -1,24 +1,600 @@
+import asyncio
+import contextlib
 import osmnx as ox
 import networkx as nx
+import numpy as np
 from typing import Tuple, List, Optional, Dict
 import logging
+import math
+from dataclasses import dataclass
 from math import radians, cos, sin, asin, sqrt
+from scipy.sparse import csr_array
+from scipy.sparse.csgraph import dijkstra
+from sklearn.neighbors import BallTree
 from app.core.exceptions import ExternalAPIException
 import os
+import gzip
 import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# SRTM1 해상도 (1 arc-second = 1/3600도, 약 30m)
+SRTM_CELLS_PER_DEGREE = 3600
+
+# 도로 네트워크 디스크 캐시 형식 버전 (캐시 키에 포함)
+GRAPH_CACHE_VERSION = 4
+# 캐시 파일 gzip 압축 레벨 (낮은 레벨로도 크기가 크게 줄고 CPU 비용은 적음)
+GRAPH_CACHE_COMPRESSLEVEL = 1
+
+# 디스크 캐시 앞단의 프로세스 내 LRU 캐시 (키: 캐시 키 해시, 값: 후처리된 그래프)
+# 같은 지역 요청이 반복될 때 pickle 파일을 다시 읽지 않도록 함
+# 캐시된 그래프는 여러 요청이 공유하므로 직접 수정하지 않고 요청마다 복사본(_copy_request_graph)을 넘김
+_graph_mem_cache: "OrderedDict[str, nx.Graph]" = OrderedDict()
+_graph_mem_cache_lock = threading.Lock()
+
+# 진행 중인 도로 네트워크 조회 (키: 캐시 키 해시)
+# 같은 지역을 동시에 요청하면 같은 조회 결과를 함께 기다려 OSM 중복 다운로드/캐시 쓰기 경합을 막음
+# 백그라운드 경로 생성은 쓰레드마다 별도 이벤트 루프(asyncio.run)에서 돌기 때문에
+# 루프에 묶인 asyncio Task 대신 concurrent.futures.Future를 공유하고 각 루프에서 wrap_future로 기다림
+_inflight_fetches: Dict[str, "Future[nx.Graph]"] = {}
+_inflight_fetches_lock = threading.Lock()
+# 공유 조회를 실행하는 전용 쓰레드 풀 (특정 이벤트 루프의 기본 executor에 묶이지 않도록)
+_network_fetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="road-network-fetch")
+
+# BBox 면적(°²)이 이 값을 넘으면 타일로 나눠서 조회 (Overpass 타임아웃 방지)
+BBOX_SPLIT_AREA = 0.01
+# 분할 시 타일 하나의 최대 면적 (°²)
+BBOX_TILE_MAX_AREA = 0.005
+# 타일 동시 조회 수 (공용 Overpass 인스턴스의 IP당 제한 고려)
+BBOX_FETCH_WORKERS = 2
+
+# 노드 좌표를 노드별 dict가 아닌 배열로 모아 둔 구조 (SoA)
+# G.graph['_node_arrays']에 보관하며, 경로 계산 시 dict 조회 대신 배열 인덱싱에 사용
+@dataclass
+class NodeArrays:
+    node_ids: np.ndarray # 노드 ID (G.nodes 순서)
+    xs: np.ndarray # 경도
+    ys: np.ndarray # 위도
+    index: Dict[int, int] # 노드 ID -> 배열 인덱스
+
+    def path_index(self, path: List[int]) -> np.ndarray:
+        """노드 ID 리스트를 배열 인덱스로 변환"""
+        index = self.index
+        return np.fromiter((index[n] for n in path), dtype=np.int64, count=len(path))
+
+
+def build_node_arrays(G: nx.Graph) -> NodeArrays:
+    """그래프의 노드 좌표(x, y)로 NodeArrays를 만든다. 좌표가 없는 노드는 NaN"""
+    node_ids = list(G.nodes())
+    nodes = G.nodes
+    xs = np.array([nodes[n].get('x', np.nan) for n in node_ids], dtype=np.float64)
+    ys = np.array([nodes[n].get('y', np.nan) for n in node_ids], dtype=np.float64)
+    index = {n: i for i, n in enumerate(node_ids)}
+    return NodeArrays(node_ids=np.array(node_ids), xs=xs, ys=ys, index=index)
+
+
+def get_node_arrays(G: nx.Graph) -> NodeArrays:
+    """
+    그래프에 캐시된 NodeArrays를 반환한다.
+    캐시가 없거나(GraphML 캐시 로드 등) 노드 수가 달라졌으면 다시 만든다.
+    """
+    arrays = G.graph.get('_node_arrays')
+    if not isinstance(arrays, NodeArrays) or len(arrays.index) != G.number_of_nodes():
+        arrays = build_node_arrays(G)
+        G.graph['_node_arrays'] = arrays
+    return arrays
+
+
+def get_node_elevations(G: nx.Graph) -> np.ndarray:
+    """
+    NodeArrays 순서에 맞춘 노드 고도 배열(고도가 없으면 NaN)을 그래프에 캐시해 두고 반환한다.
+    고도를 새로 기록하는 쪽(add_elevation_to_nodes 등)에서 캐시를 비워야 한다.
+    """
+    arrays = get_node_arrays(G)
+    elevations = G.graph.get('_node_elevations')
+    if not isinstance(elevations, np.ndarray) or elevations.shape[0] != len(arrays.node_ids):
+        # GraphML 캐시 등에서 문자열일 수 있으므로 float 변환
+        index = arrays.index
+        elevations = np.full(len(arrays.node_ids), np.nan)
+        for node, elev in G.nodes(data='elevation'):
+            if elev is not None:
+                elevations[index[node]] = float(elev)
+        G.graph['_node_elevations'] = elevations
+    return elevations
+
+
+def get_ball_tree(G: nx.Graph) -> Tuple[BallTree, np.ndarray]:
+    """
+    노드 좌표(라디안)로 만든 haversine BallTree를 그래프에 캐시해 두고 반환한다.
+    좌표가 없는 노드는 트리에서 제외하므로, 트리 행 -> NodeArrays 인덱스 매핑을 함께 반환한다.
+
+    Returns:
+        (tree, tree_to_node_index)
+    """
+    arrays = get_node_arrays(G)
+    cached = G.graph.get('_balltree')
+    if isinstance(cached, tuple) and len(cached) == 3 and cached[2] == len(arrays.index):
+        return cached[0], cached[1]
+
+    valid = np.flatnonzero(~(np.isnan(arrays.xs) | np.isnan(arrays.ys)))
+    coords_rad = np.radians(np.column_stack((arrays.ys[valid], arrays.xs[valid])))
+    tree = BallTree(coords_rad, metric='haversine')
+    G.graph['_balltree'] = (tree, valid, len(arrays.index))
+    return tree, valid
+
+
+def query_ring(
+    G: nx.Graph,
+    lat: float,
+    lng: float,
+    min_dist: float,
+    max_dist: float,
+) -> np.ndarray:
+    """
+    (lat, lng)에서 min_dist 이상 max_dist 이하(미터)인 노드의 NodeArrays 인덱스 (오름차순)
+    전체 노드를 훑지 않고 BallTree 반경 검색으로 후보만 가져온다.
+    """
+    tree, tree_to_node = get_ball_tree(G)
+    point = np.radians([[lat, lng]])
+    ind, dist = tree.query_radius(point, r=max_dist / 6371000.0, return_distance=True)
+    rows = ind[0][dist[0] * 6371000.0 >= min_dist]
+    # 노드 순서(G.nodes)대로 정렬해 동률일 때 선택 결과가 스캔 방식과 같도록 유지
+    return np.sort(tree_to_node[rows])
+
+
+def _edge_key(u: int, v: int) -> Tuple[int, int]:
+    """무방향 엣지 키 (작은 노드 ID가 앞)"""
+    return (u, v) if u <= v else (v, u)
+
+
+def build_edge_lengths(G: nx.Graph) -> Dict[Tuple[int, int], float]:
+    """
+    엣지 길이 맵 {(u, v): length}을 만든다. (u, v)와 (v, u)를 모두 넣어 조회 시 키 정렬이 필요 없음
+    length가 리스트인 경우와 평행 엣지(MultiGraph)는 가장 짧은 값으로 정리하고,
+    length가 없거나 0인 엣지는 양 끝 노드 좌표의 Haversine 거리로 미리 채운다.
+    """
+    edge_lengths: Dict[Tuple[int, int], float] = {}
+    no_length: List[Tuple[int, int]] = []
+    for u, v, length in G.edges(data='length'):
+        if length is None:
+            no_length.append((u, v))
+            continue
+        if isinstance(length, list):
+            length = min(float(x) for x in length)
+        else:
+            length = float(length)
+        if length <= 0.001:
+            no_length.append((u, v))
+            continue
+        prev = edge_lengths.get((u, v))
+        if prev is None or length < prev:
+            edge_lengths[(u, v)] = length
+            edge_lengths[(v, u)] = length
+
+    # 길이를 알 수 없는 엣지는 좌표 배열로 한 번에 계산 (좌표가 없는 노드가 낀 엣지는 0)
+    no_length = [(u, v) for u, v in no_length if (u, v) not in edge_lengths]
+    if no_length:
+        arrays = get_node_arrays(G)
+        u_idx = arrays.path_index([u for u, _ in no_length])
+        v_idx = arrays.path_index([v for _, v in no_length])
+        fallback = np.nan_to_num(
+            haversine_distance_array(arrays.xs[u_idx], arrays.ys[u_idx], arrays.xs[v_idx], arrays.ys[v_idx]),
+            nan=0.0,
+        )
+        for (u, v), length in zip(no_length, fallback.tolist()):
+            edge_lengths[(u, v)] = length
+            edge_lengths[(v, u)] = length
+    return edge_lengths
+
+
+def get_edge_lengths(G: nx.Graph) -> Dict[Tuple[int, int], float]:
+    """그래프에 캐시된 엣지 길이 맵을 반환한다. 없으면(GraphML 캐시 로드 등) 새로 만든다."""
+    edge_lengths = G.graph.get('_edge_lengths')
+    if not isinstance(edge_lengths, dict):
+        edge_lengths = build_edge_lengths(G)
+        G.graph['_edge_lengths'] = edge_lengths
+    return edge_lengths
+
+
+def _edge_length_value(data: Dict) -> float:
+    """엣지 속성의 length를 float로 (리스트면 최솟값, 없으면 inf)"""
+    length = data.get('length')
+    if length is None:
+        return math.inf
+    if isinstance(length, list):
+        return min(float(x) for x in length)
+    return float(length)
+
+
+def _shortest_undirected_edges(G: nx.MultiDiGraph) -> List[Tuple[int, int, Dict]]:
+    """
+    방향/평행 엣지를 무방향 노드 쌍으로 합치고, 쌍마다 length가 가장 짧은 엣지 속성만 남긴다.
+    Returns:
+        [(u, v, data), ...]
+    """
+    best: Dict[Tuple[int, int], Tuple[float, Dict]] = {}
+    for u, v, data in G.edges(data=True):
+        key = _edge_key(u, v)
+        length = _edge_length_value(data)
+        prev = best.get(key)
+        if prev is None or length < prev[0]:
+            best[key] = (length, data)
+    return [(u, v, data) for (u, v), (_, data) in best.items()]
+
+
+def build_weight_csr(G: nx.Graph, weight: str) -> csr_array:
+    """
+    엣지 가중치로 CSR 인접 행렬을 만든다. (행/열 순서는 NodeArrays.node_ids)
+    무방향 그래프이므로 양방향을 모두 넣고, 평행 엣지는 가장 작은 가중치만 남긴다.
+    가중치 속성이 없는 엣지는 nx.shortest_path와 동일하게 1로 본다.
+    """
+    arrays = get_node_arrays(G)
+    index = arrays.index
+    m = G.number_of_edges()
+
+    us = np.empty(m, dtype=np.int64)
+    vs = np.empty(m, dtype=np.int64)
+    weights = np.empty(m, dtype=np.float64)
+    for i, (u, v, w) in enumerate(G.edges(data=weight, default=1.0)):
+        us[i] = index[u]
+        vs[i] = index[v]
+        weights[i] = min(float(x) for x in w) if isinstance(w, list) else float(w)
+
+    return _symmetric_csr(len(arrays.node_ids), us, vs, weights)
+
+
+def _symmetric_csr(n: int, us: np.ndarray, vs: np.ndarray, weights: np.ndarray) -> csr_array:
+    """
+    엣지 배열(us[i] - vs[i], weights[i])로 양방향 CSR 행렬을 만든다.
+    같은 (row, col)이 여러 번 나오면 가장 작은 가중치만 남긴다.
+    """
+    rows = np.concatenate((us, vs))
+    cols = np.concatenate((vs, us))
+    data = np.concatenate((weights, weights)).astype(np.float64, copy=False)
+
+    # (row, col, weight) 순으로 정렬 후 (row, col)별 첫 항목(최소 가중치)만 유지
+    # coo -> csr 변환은 중복 항목을 합산하므로 미리 제거해야 함
+    order = np.lexsort((data, cols, rows))
+    rows, cols, data = rows[order], cols[order], data[order]
+    keep = np.ones(rows.shape[0], dtype=bool)
+    keep[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+
+    return csr_array((data[keep], (rows[keep], cols[keep])), shape=(n, n))
+
+
+def get_weight_csr(G: nx.Graph, weight: str) -> csr_array:
+    """
+    그래프에 캐시된 가중치 CSR 행렬을 반환한다. 없거나 노드 수가 달라졌으면 새로 만든다.
+    가중치가 바뀌면(calculate_edge_grades_and_weights) 캐시를 비워야 한다.
+    """
+    cache = G.graph.get('_weight_csr')
+    if not isinstance(cache, dict):
+        cache = {}
+        G.graph['_weight_csr'] = cache
+    A = cache.get(weight)
+    if A is None or A.shape[0] != G.number_of_nodes():
+        A = build_weight_csr(G, weight)
+        cache[weight] = A
+    return A
+
+
+def _csr_entry_positions(A: csr_array, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """CSR 행렬에서 (rows[k], cols[k]) 항목이 A.data의 몇 번째인지 반환 (없는 항목은 제외)"""
+    positions = []
+    indptr, indices = A.indptr, A.indices
+    for r, c in zip(rows.tolist(), cols.tolist()):
+        start, end = indptr[r], indptr[r + 1]
+        pos = start + np.searchsorted(indices[start:end], c)
+        if pos < end and indices[pos] == c:
+            positions.append(pos)
+    return np.array(positions, dtype=np.int64)
+
+
+def csgraph_shortest_path(
+    G: nx.Graph,
+    source: int,
+    target: int,
+    weight: str = 'length',
+    penalize_path: Optional[List[int]] = None,
+    penalty: float = 10.0,
+) -> List[int]:
+    """
+    SciPy csgraph 다익스트라로 최단 경로(노드 ID 리스트)를 구한다.
+    nx.shortest_path의 파이썬 엣지 순회 대신 캐시된 CSR 행렬 위에서 C 구현으로 탐색한다.
+
+    Args:
+        G: NetworkX 그래프
+        source: 출발 노드 ID
+        target: 도착 노드 ID
+        weight: 가중치 속성 ('length', 'weight_easy', 'weight_hard')
+        penalize_path: 가중치에 페널티를 줄 경로 (왕복 시 가는 길과 겹치지 않게)
+        penalty: penalize_path 엣지 가중치에 곱할 값
+
+    Returns:
+        노드 ID 리스트
+
+    Raises:
+        nx.NetworkXNoPath: 경로가 없을 때
+    """
+    arrays = get_node_arrays(G)
+    A = get_weight_csr(G, weight)
+
+    if penalize_path is not None and len(penalize_path) > 1:
+        # 그래프 엣지 속성을 임시로 바꿨다 되돌리는 대신 행렬 복사본에만 페널티 적용
+        idx = arrays.path_index(penalize_path)
+        rows = np.concatenate((idx[:-1], idx[1:]))
+        cols = np.concatenate((idx[1:], idx[:-1]))
+        A = A.copy()
+        A.data[np.unique(_csr_entry_positions(A, rows, cols))] *= penalty
+
+    src = arrays.index[source]
+    dst = arrays.index[target]
+    _, predecessors = dijkstra(A, directed=True, indices=src, return_predecessors=True)
+
+    if src != dst and predecessors[dst] < 0:
+        raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+
+    path_idx = [dst]
+    while path_idx[-1] != src:
+        path_idx.append(int(predecessors[path_idx[-1]]))
+    path_idx.reverse()
+    return arrays.node_ids[path_idx].tolist()
+
+
+def _split_bbox(bbox: List[float], max_area: float) -> List[List[float]]:
+    """
+    BBox를 긴 변 기준으로 반씩 나눠 모든 타일 면적이 max_area 이하가 되도록 분할한다.
+    Args:
+        bbox: [south, west, north, east]
+        max_area: 타일 최대 면적 (°²)
+    Returns:
+        [[south, west, north, east], ...]
+    """
+    south, west, north, east = bbox
+    if (north - south) * (east - west) <= max_area:
+        return [bbox]
+    if (north - south) >= (east - west):
+        mid = (south + north) / 2
+        halves = [[south, west, mid, east], [mid, west, north, east]]
+    else:
+        mid = (west + east) / 2
+        halves = [[south, west, north, mid], [south, mid, north, east]]
+    return [tile for half in halves for tile in _split_bbox(half, max_area)]
+
+
+def _network_cache_key_hash(
+    lat_rounded: float,
+    lon_rounded: float,
+    distance: float,
+    network_type: str,
+    simplify: bool,
+) -> str:
+    """도로 네트워크 캐시 키 해시 (디스크/프로세스 내 캐시, 중복 요청 병합에 공통 사용)"""
+    # 캐시 키 생성 (simplify 여부에 따라 그래프 구조가 달라지므로 키에 포함)
+    # 저장 형식이 바뀌면 GRAPH_CACHE_VERSION을 올려 이전 캐시 파일을 무시
+    cache_key = f"v{GRAPH_CACHE_VERSION}|{lat_rounded}_{lon_rounded}_{int(distance)}_{network_type}_{int(simplify)}"
+    # blake2b(16바이트): MD5와 같은 32자 hex 길이, 더 빠르고 FIPS 모드에서도 사용 가능
+    return hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest()
+
+
+def _bbox_cache_key_hash(
+    bbox: List[float],
+    network_type: str,
+    simplify: bool,
+) -> str:
+    """BBox 도로 네트워크 캐시 키 해시 (경계는 소수 4자리(약 11m)로 반올림해 키에 사용)"""
+    south, west, north, east = (round(v, 4) for v in bbox)
+    cache_key = f"v{GRAPH_CACHE_VERSION}|bbox|{south}_{west}_{north}_{east}_{network_type}_{int(simplify)}"
+    return hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest()
+
+
+def _get_mem_cached_graph(cache_key_hash: str) -> Optional[nx.Graph]:
+    with _graph_mem_cache_lock:
+        G = _graph_mem_cache.get(cache_key_hash)
+        if G is not None:
+            _graph_mem_cache.move_to_end(cache_key_hash)
+        return G
+
+
+def _put_mem_cached_graph(cache_key_hash: str, G: nx.Graph, maxsize: int) -> None:
+    if maxsize <= 0:
+        return
+    with _graph_mem_cache_lock:
+        _graph_mem_cache[cache_key_hash] = G
+        _graph_mem_cache.move_to_end(cache_key_hash)
+        while len(_graph_mem_cache) > maxsize:
+            _graph_mem_cache.popitem(last=False)
+
+
+# 요청마다 고도/경사도 계산으로 새로 기록되는 G.graph 캐시 (요청별 복사본에서는 비움)
+# 좌표 배열/엣지 길이/BallTree 캐시는 읽기 전용이므로 복사본과 공유
+_REQUEST_GRAPH_KEYS = ('_node_elevations', '_edge_grades', '_weight_csr')
+
+
+def _copy_request_graph(G: nx.Graph) -> nx.Graph:
+    """
+    공유 그래프의 요청별 복사본을 만든다.
+    노드/엣지 속성 dict를 새로 만들어 고도·경사도·가중치 기록이 원본 그래프와 다른 요청에 남지 않게 한다.
+    """
+    G_copy = G.copy()
+    for key in _REQUEST_GRAPH_KEYS:
+        G_copy.graph.pop(key, None)
+    return G_copy
+
+
+def _request_graph(G: nx.Graph) -> nx.Graph:
+    """프로세스 내 캐시에 보관된(공유되는) 그래프면 복사본을, 아니면 그대로 반환"""
+    from app.config import settings
+    if settings.OSMNX_MEM_CACHE_SIZE <= 0:
+        return G
+    return _copy_request_graph(G)
+
+
+def _finish_inflight_fetch(key: str, future: "Future[nx.Graph]") -> None:
+    """조회 완료 시 진행 중 목록에서 제거"""
+    with _inflight_fetches_lock:
+        if _inflight_fetches.get(key) is future:
+            del _inflight_fetches[key]
+
+
+def clear_graph_mem_cache() -> None:
+    """프로세스 내 도로 네트워크 캐시를 비웁니다."""
+    with _graph_mem_cache_lock:
+        _graph_mem_cache.clear()
+
+
+def _save_graph_cache(G: nx.Graph, cache_file: str) -> None:
+    """
+    후처리된 그래프를 gzip(압축 레벨 1)으로 감싼 pickle(최고 프로토콜)로 저장한다.
+    GraphML(XML)보다 저장/로드가 빠르고, 좌표 배열 등 G.graph 캐시도 그대로 보존된다.
+    임시 파일에 쓴 뒤 os.replace로 교체하므로 쓰다 만 파일이 캐시로 읽히지 않는다.
+    """
+    tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with gzip.open(tmp_file, 'wb', compresslevel=GRAPH_CACHE_COMPRESSLEVEL) as f:
+            pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def _load_graph_cache(cache_file: str) -> nx.Graph:
+    """
+    캐시 파일에서 그래프를 읽는다.
+    압축되지 않은 pickle이나 이전 형식(GraphML, '<'로 시작하는 XML)도 읽을 수 있다.
+    """
+    with open(cache_file, 'rb') as f:
+        magic = f.read(2)
+    if magic == b'\x1f\x8b':
+        with gzip.open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    if magic[:1] == b'<':
+        # GraphML은 MultiGraph로 읽히므로 후처리 결과와 같은 단순 Graph로 맞춤
+        return nx.Graph(ox.load_graphml(cache_file))
+    with open(cache_file, 'rb') as f:
+        return pickle.load(f)
+
+
+def _load_cached_network(cache_key_hash: str) -> Tuple[Optional[nx.Graph], str]:
+    """
+    프로세스 내 캐시 -> 디스크 캐시 순으로 후처리된 그래프를 찾는다.
+    TTL이 지났거나 읽을 수 없는 캐시 파일은 삭제한다.
+
+    Returns:
+        (캐시된 그래프 또는 None, 캐시 파일 경로)
+    """
+    from app.config import settings
+    cache_dir = settings.OSMNX_CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_file = os.path.join(cache_dir, f"{cache_key_hash}.pkl.gz")
+
+    # 프로세스 내 캐시 확인 (디스크 읽기/역직렬화 생략)
+    G = _get_mem_cached_graph(cache_key_hash)
+    if G is not None:
+        return G, cache_file
+
+    # 다른 요청/프로세스가 확인 도중 캐시 파일을 지울 수 있으므로 파일이 없으면 캐시 미스로 처리
+    cache_mtime = None
+    with contextlib.suppress(FileNotFoundError):
+        cache_mtime = os.path.getmtime(cache_file)
+    if cache_mtime is None:
+        return None, cache_file
+
+    # 캐시 만료 확인 (OSM 데이터 갱신 반영을 위해 오래된 캐시는 다시 받음)
+    cache_age_sec = time.time() - cache_mtime
+    if cache_age_sec > settings.OSMNX_CACHE_TTL_DAYS * 86400:
+        logger.info(f"Network cache expired ({cache_age_sec / 86400:.1f} days old). Refetching...")
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(cache_file)
+        return None, cache_file
+
+    # 캐시 확인
+    try:
+        G = _load_graph_cache(cache_file)
+        _put_mem_cached_graph(cache_key_hash, G, settings.OSMNX_MEM_CACHE_SIZE)
+        return G, cache_file
+    except FileNotFoundError:
+        # 읽기 직전에 파일이 지워짐
+        return None, cache_file
+    except Exception as e:
+        logger.warning(f"Failed to load cache: {e}. Fetching from OSM...")
+        # 캐시 로드 실패 시 파일 삭제하고 새로 다운로드
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(cache_file)
+
+    return None, cache_file
+
+
+def _store_cached_network(cache_key_hash: str, cache_file: str, G: nx.Graph) -> None:
+    """후처리된 그래프를 디스크 캐시와 프로세스 내 캐시에 저장 (디스크 저장 실패는 경고만)"""
+    from app.config import settings
+    try:
+        _save_graph_cache(G, cache_file)
+    except Exception as e:
+        logger.warning(f"Failed to save cache: {e}")
+    _put_mem_cached_graph(cache_key_hash, G, settings.OSMNX_MEM_CACHE_SIZE)
+
+
 # OSMnx를 사용한 도로 네트워크 추출
 class RoadNetworkFetcher:
     def __init__(self, timeout: int = 30):
         # OSMnx 설정
         ox.settings.use_cache = True
         ox.settings.log_console = False # 콘솔 로그 너무 많지 않게 조정
-        ox.settings.timeout = timeout
+        # OSMnx 2.x는 requests_timeout, 1.x 이전 버전은 timeout 설정을 사용
+        if hasattr(ox.settings, 'requests_timeout'):
+            ox.settings.requests_timeout = timeout
+        else:
+            ox.settings.timeout = timeout
         self.timeout = timeout
 
+    # fetch_pedestrian_network_from_point의 비동기 버전 (동시에 들어온 같은 지역 요청은 한 번만 조회)
+    async def fetch_pedestrian_network_async(
+        self,
+        center_point: Tuple[float, float], # (latitude, longitude)
+        distance: float = 1000, # 미터 단위 반경
+        network_type: str = 'walk',
+        simplify: bool = True
+    ) -> nx.Graph:
+        """
+        블로킹 조회는 쓰레드 풀에서 실행하고, 같은 캐시 키로 진행 중인 조회가 있으면 그 결과를 기다립니다.
+        인자는 fetch_pedestrian_network_from_point와 같으며, 요청마다 별도의 그래프 복사본을 반환합니다.
+        """
+        lat, lon = center_point
+        key = _network_cache_key_hash(round(lat, 3), round(lon, 3), distance, network_type, simplify)
+
+        created = False
+        with _inflight_fetches_lock:
+            future = _inflight_fetches.get(key)
+            if future is None:
+                # 조회는 요청/이벤트 루프와 분리된 전용 쓰레드 풀에서 실행하므로 먼저 온 요청이 취소되어도 계속 진행됨
+                future = _network_fetch_executor.submit(
+                    self._fetch_network_from_point,
+                    center_point, distance, network_type, simplify
+                )
+                _inflight_fetches[key] = future
+                created = True
+        if created:
+            # 이미 끝난 Future면 콜백이 즉시 실행되므로 락 밖에서 등록
+            future.add_done_callback(lambda f: _finish_inflight_fetch(key, f))
+
+        # 요청마다 현재 루프용 래퍼를 만들어 기다림
+        # shield: 이 요청이 취소되어도 래퍼가 공유 Future(대기 중일 때)를 취소하지 않음
+        waiter = asyncio.wrap_future(future)
+        # 기다리던 요청이 취소된 뒤 조회가 실패해도 예외가 조회되지 않았다는 경고가 남지 않도록 처리
+        waiter.add_done_callback(lambda f: f.cancelled() or f.exception())
+        G = await asyncio.shield(waiter)
+        # 결과 그래프는 기다린 요청 모두가 공유하므로 각자 복사본을 받아 수정
+        return await asyncio.to_thread(_copy_request_graph, G)
+
     # 출발지 좌표를 중심으로 반경 내 보행자 도로 네트워크를 추출
     def fetch_pedestrian_network_from_point (
         self,
@@ -35,8 +611,20 @@ class RoadNetworkFetcher:
             simplify: True면 불필요한 중간 노드 제거, False면 모든 노드 유지
 
         Returns:
-            NetworkX 그래프 객체 (무방향)
+            NetworkX 그래프 객체 (무방향, 캐시된 그래프면 요청별 복사본)
         """
+        return _request_graph(
+            self._fetch_network_from_point(center_point, distance, network_type, simplify)
+        )
+
+    # 캐시 또는 OSM에서 도로 네트워크를 가져옴 (프로세스 내 캐시의 공유 그래프를 그대로 반환하므로 수정 금지)
+    def _fetch_network_from_point(
+        self,
+        center_point: Tuple[float, float],
+        distance: float,
+        network_type: str,
+        simplify: bool
+    ) -> nx.Graph:
         lat, lon = center_point
         if not (-90 <= lat <= 90):
             raise ValueError(f"Invalid latitude: {lat}. Must be between -90 and 90")
@@ -47,27 +635,12 @@ class RoadNetworkFetcher:
         lat_rounded = round(lat, 3)  # 약 111m 단위
         lon_rounded = round(lon, 3)
         
-        # 캐시 키 생성
-        cache_key = f"{lat_rounded}_{lon_rounded}_{int(distance)}_{network_type}"
-        cache_key_hash = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 캐시 디렉토리 및 파일 경로
-        from app.config import settings
-        cache_dir = settings.OSMNX_CACHE_DIR
-        os.makedirs(cache_dir, exist_ok=True)
-        cache_file = os.path.join(cache_dir, f"{cache_key_hash}.gpickle")
-        
-        # 캐시 확인
-        if os.path.exists(cache_file):
-            try:
-                # logger.info(f"✅ Using cached network: {cache_key}")
-                G = ox.load_graphml(cache_file)
-                # logger.info(f"Loaded cached graph with {G.number_of_nodes()} nodes")
-                return G
-            except Exception as e:
-                logger.warning(f"Failed to load cache: {e}. Fetching from OSM...")
-                # 캐시 로드 실패 시 파일 삭제하고 새로 다운로드
-                os.remove(cache_file)
+        cache_key_hash = _network_cache_key_hash(lat_rounded, lon_rounded, distance, network_type, simplify)
+        
+        # 프로세스 내 캐시/디스크 캐시 확인
+        G, cache_file = _load_cached_network(cache_key_hash)
+        if G is not None:
+            return G
 
         try:
             # OSMnx로 도로 네트워크 가져오기 (반올림된 좌표 사용)
@@ -89,12 +662,7 @@ class RoadNetworkFetcher:
             # logger.info(f"Built graph with {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
             
             # 캐시 저장
-            try:
-                ox.save_graphml(G, cache_file)
-                # logger.info(f"Saved network to cache: {cache_file}")
-            except Exception as e:
-                logger.warning(f"Failed to save cache: {e}")
-
+            _store_cached_network(cache_key_hash, cache_file, G)
             return G
         except TimeoutError as e:
             logger.error(f"OSMnx timeout: {e}")
@@ -123,20 +691,34 @@ class RoadNetworkFetcher:
 
         south, west, north, east = bbox
         
+        # 같은 영역을 다시 요청하면 Overpass 조회/그래프 구성 없이 캐시에서 반환
+        cache_key_hash = _bbox_cache_key_hash(bbox, network_type, simplify)
+        G, cache_file = _load_cached_network(cache_key_hash)
+        if G is not None:
+            return _request_graph(G)
+
         # logger.info(f"Fetching {network_type} network from bbox: {bbox}")
 
         try:
-            # OSMnx로 도로 네트워크 가져오기
-            G = ox.graph_from_bbox(
-                north=north,
-                south=south,
-                east=east,
-                west=west,
-                network_type=network_type,
-                simplify=simplify,
-                retain_all=False, # 연결되지 않은 작은 컴포넌트 제외
-                truncate_by_edge=False
-            )
+            if (north - south) * (east - west) > BBOX_SPLIT_AREA:
+                # 큰 영역은 타일로 나눠 동시에 조회한 뒤 하나의 그래프로 합침
+                tiles = _split_bbox(bbox, BBOX_TILE_MAX_AREA)
+                # logger.info(f"Splitting bbox into {len(tiles)} tiles")
+                with ThreadPoolExecutor(max_workers=BBOX_FETCH_WORKERS) as executor:
+                    subgraphs = list(executor.map(
+                        lambda tile: self._fetch_bbox_graph(
+                            tile, network_type, simplify, retain_all=True, truncate_by_edge=True
+                        ),
+                        tiles
+                    ))
+                # 노드 ID(osmid)는 타일 간에 동일하므로 compose로 경계 노드가 자동 병합됨
+                G = nx.compose_all(subgraphs)
+                # 타일별로는 모든 컴포넌트를 유지했으므로 합친 뒤 가장 큰 컴포넌트만 남김
+                largest = max(nx.weakly_connected_components(G), key=len)
+                G = G.subgraph(largest).copy()
+            else:
+                # OSMnx로 도로 네트워크 가져오기
+                G = self._fetch_bbox_graph(bbox, network_type, simplify, retain_all=False, truncate_by_edge=False)
             # logger.info(f"Fetched graph with {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
 
             # 후처리: MultiDiGraph -> Graph 변환 및 pos 속성 추가
@@ -144,72 +726,136 @@ class RoadNetworkFetcher:
 
             # logger.info(f"Built graph with {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
 
-            return G
+            # 캐시 저장
+            _store_cached_network(cache_key_hash, cache_file, G)
+            return _request_graph(G)
         except Exception as e:
             logger.error(f"OSMnx API error: {e}")
             raise
 
+    # BBox 하나를 OSMnx로 조회 (후처리 전 MultiDiGraph)
+    def _fetch_bbox_graph(
+        self,
+        bbox: List[float], # [south, west, north, east]
+        network_type: str,
+        simplify: bool,
+        retain_all: bool,
+        truncate_by_edge: bool
+    ) -> nx.MultiDiGraph:
+        south, west, north, east = bbox
+        return ox.graph_from_bbox(
+            north=north,
+            south=south,
+            east=east,
+            west=west,
+            network_type=network_type,
+            simplify=simplify,
+            retain_all=retain_all, # False면 연결되지 않은 작은 컴포넌트 제외
+            truncate_by_edge=truncate_by_edge # True면 경계를 넘는 엣지의 바깥 노드도 유지 (타일 간 연결)
+        )
+
     # OSMnx가 반환한 MultiDiGraph를 무방향 Graph로 변환하고,
-    # 모든 노드에 pos 속성을 추가한다.
+    # 노드 좌표 배열과 엣지 길이 맵을 미리 만들어 둔다.
     def _postprocess_graph(self, G: nx.MultiDiGraph) -> nx.Graph:
         """
         Args:
             G: OSMnx가 반환한 MultiDiGraph 객체
         Returns:
-            무방향 Graph (모든 노드에 pos 속성 포함)
+            무방향 Graph (노드 좌표는 OSMnx의 x(경도), y(위도) 속성)
         """
         # MultiDiGraph -> 무방향 Graph 변환
-        G_undirected = G.to_undirected()
-
-        # 모든 노드에 pos 속성 추가 (gps_art_router.py 호환성)
-        # OSMnx는 노드에 'x'(경도), 'y'(위도) 속성을 가지고 있음
-        for node_id, data in G_undirected.nodes(data=True):
-            if 'x' in data and 'y' in data:
-                # pos는 (lon, lat) 형식
-                data['pos'] = (data['x'], data['y'])
-                # lat, lon도 별도로 유지 (호환성)
-                data['lon'] = data['x']
-                data['lat'] = data['y']
-            else:
-                logger.warning(f"Node {node_id} missing x/y coordinates")
+        # to_undirected()는 모든 노드/엣지 속성을 깊은 복사한 MultiGraph를 만들므로,
+        # 노드 쌍마다 가장 짧은 엣지 하나만 골라 단순 Graph로 직접 구성
+        G_undirected = nx.Graph()
+        G_undirected.graph.update(G.graph)
+        G_undirected.add_nodes_from(G.nodes(data=True))
+        G_undirected.add_edges_from(_shortest_undirected_edges(G))
 
-        # 고립된 노드 제거 (경로 생성에 사용 불가)
+        # 고립된 노드 제거 (경로 생성에 사용 불가, 빈 목록이면 아무 일도 하지 않음)
+        # 순회 중 삭제할 수 없으므로 목록으로 한 번만 모아서 제거
         isolated = list(nx.isolates(G_undirected))
+        G_undirected.remove_nodes_from(isolated)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Removed {len(isolated)} isolated nodes")
 
-        if isolated:
-            # logger.info(f"Removing {len(isolated)} isolated nodes")
-            G_undirected.remove_nodes_from(isolated)
+        # 노드 좌표 배열 (SoA) 및 엣지 길이 맵 생성
+        # OSMnx 노드의 'x'(경도), 'y'(위도)를 그대로 쓰며 pos/lat/lon 중복 속성은 만들지 않음
+        arrays = build_node_arrays(G_undirected)
+        missing_coords = int(np.count_nonzero(np.isnan(arrays.xs) | np.isnan(arrays.ys)))
+        if missing_coords:
+            logger.warning(f"{missing_coords} nodes missing x/y coordinates")
+        G_undirected.graph['_node_arrays'] = arrays
+        G_undirected.graph['_edge_lengths'] = build_edge_lengths(G_undirected)
+        # 좌표 BallTree도 여기서 만들어 공유 그래프/디스크 캐시에 함께 보관 (요청별 복사본은 그대로 재사용)
+        get_ball_tree(G_undirected)
 
         return G_undirected
 
     # 고도 데이터 추가
-    def add_elevation_to_nodes(self, G: nx.Graph) -> nx.Graph:
+    def add_elevation_to_nodes(
+        self,
+        G: nx.Graph,
+        origin: Optional[int] = None,
+        max_distance: Optional[float] = None
+    ) -> nx.Graph:
         """
         노드에 고도(elevation) 데이터를 추가합니다 (SRTM 로컬 데이터 사용).
+
+        Args:
+            G: NetworkX 그래프
+            origin: 출발 노드 ID (max_distance와 함께 주면 도달 가능한 노드만 조회)
+            max_distance: origin에서 도로 거리(length 기준) 이 값 이내인 노드만 고도 조회 (미터)
+                          범위 밖 노드는 고도가 없으며 경사도 0(가중치=length)으로 처리됨
         """
         try:
             from app.services.elevation_service import ElevationService
             
             elevation_service = ElevationService()
+
+            # 경로가 지나갈 수 없는 먼 노드는 고도 조회 생략
+            if origin is not None and max_distance is not None and origin in G:
+                reachable = nx.single_source_dijkstra_path_length(
+                    G, origin, cutoff=max_distance, weight='length'
+                )
+                # 범위 밖 노드에 이전 조회(다른 출발지/시뮬레이션)의 고도가 남아 있으면
+                # 경사도 계산에 섞이므로 지워서 "고도 없음(경사도 0)"을 보장
+                for node, data in G.nodes(data=True):
+                    if node not in reachable:
+                        data.pop('elevation', None)
+                target_nodes = G.subgraph(reachable).nodes(data=True)
+            else:
+                target_nodes = G.nodes(data=True)
             
-            # 모든 노드 좌표 추출 (GraphML 캐시에서 로드 시 문자열일 수 있으므로 float 변환 필수)
-            all_nodes = list(G.nodes())
-            coordinates = [(float(G.nodes[node]['y']), float(G.nodes[node]['x'])) for node in all_nodes]
+            # SRTM 격자(1초 ≈ 30m) 단위로 노드를 묶어 격자당 대표 좌표 1개만 조회
+            # SRTM은 격자 내 표본값을 그대로 반환하므로 같은 격자 노드는 고도가 동일함
+            # (GraphML 캐시에서 로드 시 문자열일 수 있으므로 float 변환 필수)
+            cell_nodes: Dict[Tuple[int, int], List] = {}
+            cell_coords: Dict[Tuple[int, int], Tuple[float, float]] = {}
+            for node, data in target_nodes:
+                lat = float(data['y'])
+                lon = float(data['x'])
+                cell = (math.floor(-lat * SRTM_CELLS_PER_DEGREE), math.floor(lon * SRTM_CELLS_PER_DEGREE))
+                if cell not in cell_nodes:
+                    cell_nodes[cell] = []
+                    cell_coords[cell] = (lat, lon)
+                cell_nodes[cell].append(node)
             
             # 배치 조회
-            elevations = elevation_service.get_elevations_batch(coordinates)
+            elevations = elevation_service.get_elevations_batch(list(cell_coords.values()))
             
-            # 노드에 반영 (float 변환 보장)
+            # 격자별 고도를 소속 노드 전체에 반영 (float 변환 보장)
             applied_count = 0
-            for node in all_nodes:
-                lat = float(G.nodes[node]['y'])
-                lon = float(G.nodes[node]['x'])
-                elev = elevations.get((lat, lon), 20.0)
-                G.nodes[node]['elevation'] = float(elev)
+            for cell, nodes in cell_nodes.items():
+                elev = float(elevations.get(cell_coords[cell], 20.0))
+                for node in nodes:
+                    G.nodes[node]['elevation'] = elev
                 if elev != 20.0:
-                    applied_count += 1
+                    applied_count += len(nodes)
+            G.graph.pop('_node_elevations', None)
             
-            logger.info(f"⛰️ Elevation applied: {applied_count}/{len(all_nodes)} nodes got real data (rest=20.0 default)")
+            queried_count = sum(len(nodes) for nodes in cell_nodes.values())
+            logger.info(f"⛰️ SRTM cells queried: {len(cell_coords)} for {queried_count}/{G.number_of_nodes()} nodes")
+            logger.info(f"⛰️ Elevation applied: {applied_count}/{queried_count} nodes got real data (rest=20.0 default)")
             
         except Exception as e:
             logger.warning(f"⚠️ SRTM 고도 조회 실패, 시뮬레이션 데이터 사용: {e}")
@@ -219,69 +865,101 @@ class RoadNetworkFetcher:
 
 
 
-    def _add_simulated_elevation(self, G: nx.Graph):
-        """가상의 지형 굴곡을 노드에 부여합니다."""
+    def _add_simulated_elevation(self, G: nx.Graph, seed: Optional[int] = None):
+        """가상의 지형 굴곡을 노드에 부여합니다. (seed를 주면 같은 지형을 재현)"""
         import random
-        import math
+        rng = random.Random(seed)
         
         # 지역 전체의 기본 고도와 변화 진폭 설정
-        base_elevation = random.uniform(10, 50)
-        amplitude = random.uniform(5, 30)
-        frequency = random.uniform(500, 1500) # 지형 변화 주기 (미터)
+        base_elevation = rng.uniform(10, 50)
+        amplitude = rng.uniform(5, 30)
+        frequency = rng.uniform(500, 1500) # 지형 변화 주기 (미터)
+        
+        # 캐시된 노드 좌표 배열(SoA)로 전체 노드를 한 번에 계산
+        arrays = get_node_arrays(G)
+        lats, lons = arrays.ys, arrays.xs
         
         # 랜덤한 중심점 2~3개를 잡아 산/언덕처럼 표현
+        # (노드 목록을 매번 리스트로 만들지 않고 배열 인덱스를 뽑음)
         center_points = []
         for _ in range(3):
-            random_node = random.choice(list(G.nodes()))
-            center_points.append((G.nodes[random_node]['y'], G.nodes[random_node]['x'], random.uniform(20, 100)))
+            i = rng.randrange(len(arrays.node_ids))
+            center_points.append((lats[i], lons[i], rng.uniform(20, 100)))
 
-        for node, data in G.nodes(data=True):
-            lat, lon = data['y'], data['x']
-            # 기본적인 물결 모양 지형
-            elev = base_elevation + amplitude * math.sin(lat * frequency) * math.cos(lon * frequency)
-            
-            # 특정 지점을 언덕으로 설정
-            for c_lat, c_lon, height in center_points:
-                dist = ox.distance.great_circle(lat, lon, c_lat, c_lon)
-                if dist < 500: # 500m 반경 내 언덕 효과
-                    elev += height * (1 - (dist / 500))
-            
-            data['elevation'] = round(elev, 2)
+        # 기본적인 물결 모양 지형
+        elev = base_elevation + amplitude * np.sin(lats * frequency) * np.cos(lons * frequency)
+        
+        # 특정 지점을 언덕으로 설정: (k, 3) 중심점 배열과 (k, N) 거리 행렬로 한 번에 계산
+        # 시뮬레이션 지형이라 미터 단위 정확도가 필요 없으므로 하버사인 대신 등장방형 근사 거리 사용
+        # (500m 반경에서 오차 0.5% 미만, asin/sqrt 등 삼각 함수 연산 절감)
+        centers = np.array(center_points, dtype=np.float64)
+        cos_lat0 = math.cos(math.radians(float(np.nanmean(lats))))
+        dx = 6371000.0 * cos_lat0 * np.radians(lons[None, :] - centers[:, 1:2])
+        dy = 6371000.0 * np.radians(lats[None, :] - centers[:, 0:1])
+        dist = np.hypot(dx, dy)
+        heights = centers[:, 2:3]
+        # 500m 반경 내 언덕 효과
+        elev += np.where(dist < 500, heights * (1 - (dist / 500)), 0.0).sum(axis=0)
+        
+        elev = np.round(elev, 2)
+        nodes = G.nodes
+        for node_id, e in zip(arrays.node_ids.tolist(), elev.tolist()):
+            nodes[node_id]['elevation'] = e
+        G.graph['_node_elevations'] = elev
 
     # 엣지에 경사도 및 가중치 계산
     def calculate_edge_grades_and_weights(self, G: nx.Graph):
         """노드 간 고도 차이를 이용해 경사도(grade)를 구하고 가중치를 설정합니다."""
-        non_zero_grades = 0
-        for u, v, data in G.edges(data=True):
-            # 노드 데이터 가져오기
-            node_u = G.nodes[u]
-            node_v = G.nodes[v]
-            
-            if 'elevation' in node_u and 'elevation' in node_v:
-                # 고도 차이 (미터) - float 변환 보장
-                elev_u = float(node_u['elevation'])
-                elev_v = float(node_v['elevation'])
-                elev_diff = elev_v - elev_u
-                dist = float(data.get('length', 1.0))
-                if dist < 1.0: dist = 1.0 # 0 나누기 방지
-                
-                # 경사도 (%)
-                grade = (elev_diff / dist)
-                data['grade'] = grade
-                if abs(grade) > 0.001:
-                    non_zero_grades += 1
-                
-                # 가중치 계산 (보행자는 오르막/내리막 모두 힘듦)
-                abs_grade = abs(grade)
-                
-                # 쉬운 길 (경사도 기피): 경사가 급할수록 페널티 대폭 증가
-                data['weight_easy'] = dist * (1 + abs_grade * 20) 
-                # 어려운 길 (경사도 선호): 경사가 있을수록 거리를 짧게 인식하게 하여 선택 유도
-                data['weight_hard'] = dist * (1 + (0.5 - abs_grade) * 2) if abs_grade < 0.2 else dist
-            else:
-                data['grade'] = 0
-                data['weight_easy'] = float(data.get('length', 1.0))
-                data['weight_hard'] = float(data.get('length', 1.0))
+        # 엣지 목록을 (u 인덱스, v 인덱스, length) 배열로 한 번 모은 뒤 경사도/가중치를 NumPy로 일괄 계산
+        # (엣지마다 노드 dict 조회와 파이썬 산술을 반복하지 않도록)
+        arrays = get_node_arrays(G)
+        index = arrays.index
+        n = len(arrays.node_ids)
+        edges = list(G.edges(data=True))
+        m = len(edges)
+
+        us = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=m)
+        vs = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=m)
+        lengths = np.fromiter((float(d.get('length', 1.0)) for _, _, d in edges), dtype=np.float64, count=m)
+
+        # 노드 고도 배열 (없으면 NaN)
+        node_elev = get_node_elevations(G)
+
+        elev_u = node_elev[us]
+        elev_v = node_elev[vs]
+        has_elev = ~(np.isnan(elev_u) | np.isnan(elev_v))
+
+        # 고도 차이 (미터) / 거리 (0 나누기 방지) -> 경사도, 고도가 없으면 0
+        dist = np.maximum(lengths, 1.0)
+        grade = np.where(has_elev, (elev_v - elev_u) / dist, 0.0)
+        # 가중치 계산 (보행자는 오르막/내리막 모두 힘듦)
+        abs_grade = np.abs(grade)
+        non_zero_grades = int(np.count_nonzero(has_elev & (abs_grade > 0.001)))
+
+        # 쉬운 길 (경사도 기피): 경사가 급할수록 페널티 대폭 증가
+        w_easy = np.where(has_elev, dist * (1 + abs_grade * 20), lengths)
+        # 어려운 길 (경사도 선호): 경사가 있을수록 거리를 짧게 인식하게 하여 선택 유도
+        w_hard = np.where(
+            has_elev,
+            np.where(abs_grade < 0.2, dist * (1 + (0.5 - abs_grade) * 2), dist),
+            lengths,
+        )
+
+        # 엣지 속성 및 경로 통계용 경사도 맵 {(u, v): grade}에 한 번에 기록
+        edge_grades: Dict[Tuple[int, int], float] = {}
+        for (u, v, data), g, we, wh in zip(edges, grade.tolist(), w_easy.tolist(), w_hard.tolist()):
+            data['grade'] = g
+            data['weight_easy'] = we
+            data['weight_hard'] = wh
+            edge_grades[_edge_key(u, v)] = g
+
+        G.graph['_edge_grades'] = edge_grades
+        # 가중치가 바뀌었으므로 경로 탐색용 CSR 행렬을 새 가중치로 교체
+        # ('length' 등 나머지 가중치는 탐색 시 get_weight_csr가 필요할 때 만듦)
+        G.graph['_weight_csr'] = {
+            'weight_easy': _symmetric_csr(n, us, vs, w_easy),
+            'weight_hard': _symmetric_csr(n, us, vs, w_hard),
+        }
         
         logger.info(f"📐 Edge grades calculated: {non_zero_grades}/{G.number_of_edges()} edges have non-zero grade")
 
@@ -302,47 +980,31 @@ class RoadNetworkFetcher:
         if len(path) < 2:
             return 0.0
 
-        total_distance = 0.0
+        # 후처리 시 정리해 둔 엣지 길이 맵(양방향 키, 길이 없는 엣지는 Haversine으로 채움)을
+        # 구간마다 한 번씩만 조회
+        edge_lengths = get_edge_lengths(graph)
+        pairs = list(zip(path[:-1], path[1:]))
+        edge_lens = np.fromiter(
+            (edge_lengths.get(pair, np.nan) for pair in pairs), dtype=np.float64, count=len(pairs)
+        )
 
-        for i in range(len(path) - 1):
-            node1 = path[i]
-            node2 = path[i + 1]
+        # 그래프에 없는 구간 (이론상 없어야 함): 한 번만 경고하고 Haversine으로 계산
+        missing = np.isnan(edge_lens)
+        if missing.any():
+            logger.warning(
+                f"{int(missing.sum())} edges missing in graph (e.g. {pairs[int(np.argmax(missing))]})"
+            )
+            arrays = get_node_arrays(graph)
+            path_idx = arrays.path_index(path)
+            u_idx = path_idx[:-1][missing]
+            v_idx = path_idx[1:][missing]
+            fallback = haversine_distance_array(
+                arrays.xs[u_idx], arrays.ys[u_idx], arrays.xs[v_idx], arrays.ys[v_idx]
+            )
+            # 좌표가 없는 노드가 낀 구간은 0으로 처리
+            edge_lens[missing] = np.nan_to_num(fallback, nan=0.0)
 
-            if not graph.has_edge(node1, node2):
-                # 엣지가 없는 경우 (이론상 없어야 함)
-                logger.warning(f"Edge ({node1}, {node2}) missing in graph")
-                pos1 = graph.nodes[node1].get('pos')
-                pos2 = graph.nodes[node2].get('pos')
-                if pos1 and pos2:
-                    total_distance += haversine_distance(pos1, pos2)
-            else:
-                # 엣지 데이터 가져오기
-                edge_data = graph.get_edge_data(node1, node2)
-                edge_len = 0.0
-                
-                # 1. 'length' 속성 시도
-                if isinstance(edge_data, dict):
-                     length = edge_data.get('length')
-                     if length is not None:
-                         if isinstance(length, list):
-                             edge_len = min(float(x) for x in length)
-                         else:
-                             edge_len = float(length)
-                
-                # 2. 'length'가 없거나 0이면 Haversine으로 계산 (Fallback)
-                if edge_len <= 0.001:
-                    # OSMnx 그래프는 'x'(경도), 'y'(위도) 속성 사용
-                    lon1 = graph.nodes[node1].get('x')
-                    lat1 = graph.nodes[node1].get('y')
-                    lon2 = graph.nodes[node2].get('x')
-                    lat2 = graph.nodes[node2].get('y')
-                    
-                    if lon1 and lat1 and lon2 and lat2:
-                        edge_len = haversine_distance((lon1, lat1), (lon2, lat2))
-                        
-                total_distance += edge_len
-
-        return total_distance
+        return float(edge_lens.sum())
 
     # 경로를 카카오 지도 좌표 형식으로 변환
     def path_to_kakao_coordinates(
@@ -358,71 +1020,59 @@ class RoadNetworkFetcher:
         Returns:
             [{'lat': y, "lng": x}, ...] 형식의 리스트
         """
-        coordinates = []
-
-        for node_id in path:
-            node_data = graph.nodes[node_id]
-
-            # OSMnx 그래프는 'x'(경도), 'y'(위도) 속성 사용
-            if 'x' in node_data and 'y' in node_data:
-                lng = node_data['x']
-                lat = node_data['y']
-                coordinates.append({
-                    'lat': float(lat),
-                    'lng': float(lng)
-                })
-            else:
+        # 노드별 dict 조회 대신 캐시된 좌표 배열(SoA)을 경로 인덱스로 한 번에 슬라이싱
+        arrays = get_node_arrays(graph)
+        path_idx = arrays.path_index(path)
+        lngs = arrays.xs[path_idx]
+        lats = arrays.ys[path_idx]
+
+        # OSMnx 그래프는 'x'(경도), 'y'(위도) 속성 사용 (없으면 NaN)
+        valid = ~(np.isnan(lngs) | np.isnan(lats))
+        if not valid.all():
+            for node_id in arrays.node_ids[path_idx[~valid]].tolist():
                 logger.warning(f"Node {node_id} missing x/y coordinate data")
+            lngs = lngs[valid]
+            lats = lats[valid]
 
-        return coordinates
+        return [
+            {'lat': lat, 'lng': lng}
+            for lat, lng in zip(lats.tolist(), lngs.tolist())
+        ]
 
     def get_elevation_stats(self, G: nx.Graph, path: List[int]) -> Dict:
         """경로의 고도 통계(총 상승 고도, 평균 경사도 등)를 계산합니다."""
-        total_ascent = 0.0
-        total_descent = 0.0
-        grades = []
-        elevations = []
-        total_elevation_change = 0.0
-        
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i+1]
-            node_u = G.nodes[u]
-            node_v = G.nodes[v]
-            
-            if 'elevation' in node_u and 'elevation' in node_v:
-                elev_u = float(node_u['elevation'])
-                elev_v = float(node_v['elevation'])
-                
-                if i == 0:
-                    elevations.append(elev_u)
-                elevations.append(elev_v)
-                
-                diff = elev_v - elev_u
-                total_elevation_change += abs(diff)
-                
-                if diff > 0:
-                    total_ascent += diff
-                else:
-                    total_descent += abs(diff)
-                
-                # 경사도 수집 (MultiGraph의 경우 {0: {attrs}} 형식)
-                edge_data = G.get_edge_data(u, v)
-                if edge_data is not None:
-                    # MultiGraph: {0: {'grade': 0.02, ...}} 형식
-                    if isinstance(edge_data, dict) and 'grade' not in edge_data:
-                        first_key = next(iter(edge_data), None)
-                        if first_key is not None and isinstance(edge_data[first_key], dict):
-                            edge_data = edge_data[first_key]
-                    if isinstance(edge_data, dict) and 'grade' in edge_data:
-                        grades.append(abs(float(edge_data['grade'])))
-        
-        avg_grade = (sum(grades) / len(grades)) * 100 if grades else 0
+        # 경로 노드의 고도를 캐시된 고도 배열에서 한 번에 슬라이싱하고 구간 차이를 NumPy로 집계
+        elev = get_node_elevations(G)[get_node_arrays(G).path_index(path)]
+        # 양 끝 노드 모두 고도가 있는 구간만 집계
+        has_elev = ~(np.isnan(elev[:-1]) | np.isnan(elev[1:]))
+        diffs = np.diff(elev)[has_elev]
+        
+        total_ascent = float(diffs[diffs > 0].sum())
+        total_descent = float(-diffs[diffs <= 0].sum())
+        total_elevation_change = float(np.abs(diffs).sum())
+        # 집계 구간의 도착 노드 고도 (+ 첫 구간이 집계되면 출발 노드 고도)
+        elevations = elev[1:][has_elev]
+        if has_elev.size and has_elev[0]:
+            elevations = np.concatenate((elev[:1], elevations))
+        
+        # 경사도 수집 (calculate_edge_grades_and_weights에서 만든 경사도 맵 사용)
+        edge_grades = G.graph.get('_edge_grades')
+        if not isinstance(edge_grades, dict):
+            edge_grades = {}
+        steps = np.flatnonzero(has_elev).tolist()
+        grades = np.abs(np.fromiter(
+            (edge_grades.get(_edge_key(path[i], path[i + 1]), np.nan) for i in steps),
+            dtype=np.float64, count=len(steps)
+        ))
+        grades = grades[~np.isnan(grades)]
+        
+        avg_grade = float(grades.mean()) * 100 if grades.size else 0
         if avg_grade > 99.99: avg_grade = 99.99
         
-        max_grade = max(grades) * 100 if grades else 0
+        max_grade = float(grades.max()) * 100 if grades.size else 0
         if max_grade > 99.99: max_grade = 99.99
         
-        max_elev_diff = (max(elevations) - min(elevations)) if elevations else 0
+        max_elev_diff = float(elevations.max() - elevations.min()) if elevations.size else 0
         
         logger.info(f"📊 Elevation stats: ascent={total_ascent:.1f}m, descent={total_descent:.1f}m, avg_grade={avg_grade:.2f}%, max_grade={max_grade:.2f}%, max_elev_diff={max_elev_diff:.1f}m")
         
@@ -448,17 +1098,10 @@ class RoadNetworkFetcher:
         Returns:
             총 고도 변화량 (미터) - 오르막/내리막 절대값 누적
         """
-        total_change = 0.0
-        
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i+1]
-            node_u = G.nodes[u]
-            node_v = G.nodes[v]
-            
-            if 'elevation' in node_u and 'elevation' in node_v:
-                # float 변환 후 절대값을 씌워서 누적
-                elev_diff = abs(float(node_v['elevation']) - float(node_u['elevation']))
-                total_change += elev_diff
+        # 캐시된 고도 배열에서 경로 노드 고도를 한 번에 가져와 구간 차이의 절대값 합산
+        # (고도가 없는 노드가 낀 구간은 NaN이 되므로 nansum으로 제외)
+        elev = get_node_elevations(G)[get_node_arrays(G).path_index(path)]
+        total_change = float(np.nansum(np.abs(np.diff(elev))))
         
         return round(total_change, 2)
 
@@ -488,10 +1131,10 @@ class RoadNetworkFetcher:
         lon_diff = east - west
         area = lat_diff * lon_diff
 
-        if area > 0.01: # 약 1km² 이상
+        if area > BBOX_SPLIT_AREA: # 약 1km² 이상
             logger.warning(
                 f"Large area detected ({area:.4f}°²)."
-                f"Query might timeout. Consider splitting the area."
+                f"Query will be split into tiles to avoid timeout."
             )
 
     # Fallback: 자연스러운 랜덤 루프 경로 생성
@@ -524,6 +1167,8 @@ class RoadNetworkFetcher:
         # 각 꼭짓점까지의 거리 (대략적으로 전체 거리를 꼭짓점 수로 나눈 것의 절반 정도 반지름)
         # 단순히 원형으로 배치하되, 각도와 거리에 랜덤성을 부여
         avg_radius_km = (target_distance_km / (2 * math.pi)) # 둘레 기반 반지름 추정
+        # km -> 위도 도 단위 변환 (위도 1도 ≈ 111km)은 한 번만 계산
+        avg_radius_deg = avg_radius_km / 111.0
         
         points = []
         # 시작점 추가
@@ -536,15 +1181,20 @@ class RoadNetworkFetcher:
         
         # 1. 중심점 계산 (시작점에서 임의의 방향으로 반지름만큼 이동한 곳을 원의 중심으로 가정)
         center_angle = rng.uniform(0, 360)
-        center_dist_deg = (avg_radius_km) / 111.0
+        center_dist_deg = avg_radius_deg
+        
+        # 반복해서 쓰는 삼각 함수 값은 한 번만 계산
+        center_angle_rad = math.radians(center_angle)
+        cos_start_lat = math.cos(math.radians(start_lat))
         
-        circle_center_lat = start_lat + center_dist_deg * math.cos(math.radians(center_angle))
-        circle_center_lng = start_lng + (center_dist_deg * math.sin(math.radians(center_angle)) / math.cos(math.radians(start_lat)))
+        circle_center_lat = start_lat + center_dist_deg * math.cos(center_angle_rad)
+        circle_center_lng = start_lng + (center_dist_deg * math.sin(center_angle_rad) / cos_start_lat)
+        inv_cos_center_lat = 1.0 / math.cos(math.radians(circle_center_lat))
         
         # 2. 원 위의 점들 생성 (시작점 포함)
         # 시작점의 각도 계산
         start_angle_rad = math.atan2(
-            (start_lng - circle_center_lng) * math.cos(math.radians(start_lat)), 
+            (start_lng - circle_center_lng) * cos_start_lat, 
             start_lat - circle_center_lat
         )
         
@@ -555,52 +1205,30 @@ class RoadNetworkFetcher:
         # 시작점 (정확히 입력받은 위치)
         route_points.append({"lat": start_lat, "lng": start_lng})
         
-        for i in range(1, num_points):
-            # 각도: 시작 각도 + 단계별 각도 + 약간의 랜덤성
-            angle = start_angle_rad + (i * angle_step) + rng.uniform(-0.2, 0.2)
-            
-            # 거리: 평균 반지름 + 약간의 랜덤성 (찌그러뜨리기)
-            radius_variation = rng.uniform(0.8, 1.2)
-            r_deg = (avg_radius_km * radius_variation) / 111.0
-            
-            p_lat = circle_center_lat + r_deg * math.cos(angle)
-            p_lng = circle_center_lng + (r_deg * math.sin(angle) / math.cos(math.radians(circle_center_lat)))
-            
-            route_points.append({"lat": p_lat, "lng": p_lng})
+        # 꼭짓점별 (각도 랜덤성, 반지름 랜덤성) - 시드별 모양이 유지되도록 기존과 같은 순서로 뽑음
+        jitter = np.array(
+            [(rng.uniform(-0.2, 0.2), rng.uniform(0.8, 1.2)) for _ in range(1, num_points)],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        
+        # 각도: 시작 각도 + 단계별 각도 + 약간의 랜덤성
+        angles = start_angle_rad + np.arange(1, num_points) * angle_step + jitter[:, 0]
+        # 거리: 평균 반지름 + 약간의 랜덤성 (찌그러뜨리기)
+        r_deg = avg_radius_deg * jitter[:, 1]
+        
+        # 전체 꼭짓점 좌표를 한 번에 계산
+        p_lats = circle_center_lat + r_deg * np.cos(angles)
+        p_lngs = circle_center_lng + r_deg * np.sin(angles) * inv_cos_center_lat
+        route_points.extend(
+            {"lat": p_lat, "lng": p_lng}
+            for p_lat, p_lng in zip(p_lats.tolist(), p_lngs.tolist())
+        )
             
         # 다시 시작점으로 (Loop 완성)
         route_points.append({"lat": start_lat, "lng": start_lng})
         
         return route_points
 
-# 구 위에 두 지점 사이의 최단 거리(대권 거리, Great-circle distance)를 구하는 공식 (미터 단위)
-def haversine_distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
-    """
-    Args:
-        pos1: (longitude, latitude)
-        pos2: (longitude, latitude)
-
-    Returns:
-        거리 (미터)
-    """
-    lon1, lat1 = pos1
-    lon2, lat2 = pos2
-
-    # 라디안 변환
-    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-
-    # Haversine 공식
-    # a = sin²(Δlat / 2) + cos(lat1) · cos(lat2) · sin²(Δlon / 2)
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
-
-    # 지구 반지름 (미터)
-    r = 6371000
-
-    # 호의 길이
-    return c * r
     # 가장 가까운 노드 찾기
     def get_nearest_node(self, G: nx.Graph, point: Tuple[float, float]) -> int:
         """
@@ -653,88 +1281,116 @@ def haversine_distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) ->
         min_dist = target_radius_m * 0.8
         max_dist = target_radius_m * 1.2
         
-        candidate_nodes = []
-        
         start_data = G.nodes[start_node]
-        start_lat = start_data['y']
-        start_lng = start_data['x']
-        
-        for node, data in G.nodes(data=True):
-            if 'y' not in data or 'x' not in data:
-                continue
-                
-            node_lat = data['y']
-            node_lng = data['x']
-            
-            # 거리 계산
-            dist = ox.distance.great_circle(start_lat, start_lng, node_lat, node_lng)
+        start_lat = float(start_data['y'])
+        start_lng = float(start_data['x'])
+        
+        # 전체 노드를 훑지 않고 캐시된 BallTree로 목표 반경 고리 안의 노드만 조회
+        arrays = get_node_arrays(G)
+        in_ring = query_ring(G, start_lat, start_lng, min_dist, max_dist)
+        dest_node = None
+        if in_ring.size:
+            # 방위각 계산 (반경 조건을 만족하는 노드만)
+            lat1 = math.radians(start_lat)
+            lat2 = np.radians(arrays.ys[in_ring])
+            dlng = np.radians(arrays.xs[in_ring] - start_lng)
+            y = np.sin(dlng) * np.cos(lat2)
+            x = math.cos(lat1) * np.sin(lat2) - math.sin(lat1) * np.cos(lat2) * np.cos(dlng)
+            calc_bearing = (np.degrees(np.arctan2(y, x)) + 360) % 360
             
-            if min_dist <= dist <= max_dist:
-                # 방위각 계산
-                y = math.sin(math.radians(node_lng - start_lng)) * math.cos(math.radians(node_lat))
-                x = math.cos(math.radians(start_lat)) * math.sin(math.radians(node_lat)) - \
-                    math.sin(math.radians(start_lat)) * math.cos(math.radians(node_lat)) * \
-                    math.cos(math.radians(node_lng - start_lng))
-                calc_bearing = math.degrees(math.atan2(y, x))
-                calc_bearing = (calc_bearing + 360) % 360
-                
-                angle_diff = abs(calc_bearing - bearing)
-                angle_diff = min(angle_diff, 360 - angle_diff)
-                
-                if angle_diff < 40:
-                    candidate_nodes.append((node, angle_diff))
-        
-        if not candidate_nodes:
-            # 방향 조건 완화하여 다시 검색
-            for node, data in G.nodes(data=True):
-                 if 'y' not in data or 'x' not in data: continue
-                 dist = ox.distance.great_circle(start_lat, start_lng, data['y'], data['x'])
-                 if min_dist * 0.7 <= dist <= max_dist * 1.3:
-                     candidate_nodes.append((node, random.uniform(0, 100)))
-        
-        if not candidate_nodes:
-            logger.warning("No destination validation candidates found.")
-            return []
+            angle_diff = np.abs(calc_bearing - bearing)
+            angle_diff = np.minimum(angle_diff, 360 - angle_diff)
             
-        # 가장 조건에 맞는 노드 선택
-        candidate_nodes.sort(key=lambda x: x[1])
-        dest_node = candidate_nodes[0][0]
+            in_direction = angle_diff < 40
+            if in_direction.any():
+                # 가장 조건에 맞는(각도 차가 가장 작은) 노드 선택
+                candidates = in_ring[in_direction]
+                dest_node = arrays.node_ids[candidates[np.argmin(angle_diff[in_direction])]].item()
         
-        # 2. 경로 탐색 (가는 길)
+        if dest_node is None:
+            # 방향 조건 완화하여 다시 검색 (범위 내 임의 노드)
+            relaxed = query_ring(G, start_lat, start_lng, min_dist * 0.7, max_dist * 1.3)
+            if relaxed.size == 0:
+                logger.warning("No destination validation candidates found.")
+                return []
+            dest_node = arrays.node_ids[random.choice(relaxed.tolist())].item()
+        
+        # 2. 경로 탐색 (가는 길) - 캐시된 CSR 가중치 행렬에서 SciPy 다익스트라
         try:
-            route_to = nx.shortest_path(G, start_node, dest_node, weight=weight)
+            route_to = csgraph_shortest_path(G, start_node, dest_node, weight=weight)
         except nx.NetworkXNoPath:
             return []
             
         # 3. 오는 길 (가는 길과 겹치지 않게 페널티 부여)
-        # 엣지 가중치 임시 변경
-        original_weights = {}
-        for u, v in zip(route_to[:-1], route_to[1:]):
-            if G.has_edge(u, v):
-                edge_data = G.get_edge_data(u, v)
-                # MultiGraph 처리
-                if 0 in edge_data:
-                    edge_data = edge_data[0]
-                
-                # 가중치 키가 존재하는지 확인
-                current_weight_key = weight if weight in edge_data else 'length'
-                
-                if current_weight_key in edge_data:
-                    original_weights[(u, v, current_weight_key)] = edge_data[current_weight_key]
-                    edge_data[current_weight_key] *= 10 # 페널티
-        
+        # 그래프 엣지 가중치를 임시로 바꾸지 않고 행렬 복사본에만 페널티 적용
         try:
-            route_from = nx.shortest_path(G, dest_node, start_node, weight=weight)
+            route_from = csgraph_shortest_path(
+                G, dest_node, start_node, weight=weight, penalize_path=route_to
+            )
         except nx.NetworkXNoPath:
             route_from = route_to[::-1] # 되돌아오기
-        finally:
-            # 가중치 복구
-            for (u, v, k), w in original_weights.items():
-                if G.has_edge(u, v):
-                     edge_data = G.get_edge_data(u, v)
-                     if 0 in edge_data: edge_data = edge_data[0]
-                     edge_data[k] = w
-                     
+
         # 4. 경로 합치기
         full_route = route_to + route_from[1:]
         return full_route
+
+@lru_cache(maxsize=None)
+def get_road_network_fetcher(timeout: int = 30) -> RoadNetworkFetcher:
+    """
+    프로세스에서 공유하는 RoadNetworkFetcher를 반환한다.
+    상태가 없는 객체이므로 요청마다 새로 만들지 않고 재사용해 OSMnx 전역 설정을 매번 다시 쓰지 않는다.
+    """
+    return RoadNetworkFetcher(timeout=timeout)
+
+
+# 구 위에 두 지점 사이의 최단 거리(대권 거리, Great-circle distance)를 구하는 공식 (미터 단위)
+def haversine_distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
+    """
+    Args:
+        pos1: (longitude, latitude)
+        pos2: (longitude, latitude)
+
+    Returns:
+        거리 (미터)
+    """
+    lon1, lat1 = pos1
+    lon2, lat2 = pos2
+
+    # 라디안 변환
+    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
+
+    # Haversine 공식
+    # a = sin²(Δlat / 2) + cos(lat1) · cos(lat2) · sin²(Δlon / 2)
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+    c = 2 * asin(sqrt(a))
+
+    # 지구 반지름 (미터)
+    r = 6371000
+
+    # 호의 길이
+    return c * r
+
+
+# haversine_distance의 NumPy 벡터화 버전 (배열 원소별로 계산, 미터 단위)
+def haversine_distance_array(
+    lon1: np.ndarray, lat1: np.ndarray,
+    lon2: np.ndarray, lat2: np.ndarray,
+) -> np.ndarray:
+    """
+    Args:
+        lon1, lat1: 시작점 경도/위도 배열 (도 단위)
+        lon2, lat2: 끝점 경도/위도 배열 (도 단위, lon1/lat1과 같은 shape)
+
+    Returns:
+        거리 배열 (미터)
+    """
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2.0) ** 2
+    c = 2.0 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    return c * 6371000.0
@@ -6,11 +6,14 @@
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 import uuid
 
 from app.models.route import Route, RouteOption, SavedRoute, RouteGenerationTask, RouteShape
 from app.core.exceptions import NotFoundException, ValidationException
+from app.db.database import is_duplicate_key_error
 
 
 class RouteService:
@@ -152,22 +155,23 @@ class RouteService:
             route_id: 생성된 경로 ID (완료 시)
             error_message: 에러 메시지 (실패 시)
         """
-        task = self.db.query(RouteGenerationTask).filter(
-            RouteGenerationTask.id == task_id
-        ).first()
-        
-        if task:
-            task.status = status
-            
-            if status == "processing":
-                task.started_at = datetime.utcnow()
-            elif status == "completed":
-                task.route_id = route_id
-                task.completed_at = datetime.utcnow()
-            elif status == "failed":
-                task.error_message = error_message
-            
-            self.db.commit()
+        # Task를 먼저 SELECT하지 않고 UPDATE 한 번으로 상태 변경 (없는 Task면 0행 갱신)
+        # (route_generation_tasks에는 started_at 컬럼이 없으므로 processing은 상태만 변경)
+        values: Dict[str, Any] = {"status": status}
+        
+        if status == "completed":
+            values["route_id"] = route_id
+            values["completed_at"] = datetime.utcnow()
+        elif status == "failed":
+            values["error_message"] = error_message
+        
+        self.db.execute(
+            update(RouteGenerationTask)
+            .where(RouteGenerationTask.id == task_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
     
     
     # ============================================
@@ -253,18 +257,6 @@ class RouteService:
         Raises:
             ValidationException: 이미 저장한 경로인 경우
         """
-        # 이미 저장했는지 확인
-        existing = self.db.query(SavedRoute).filter(
-            SavedRoute.user_id == user_id,
-            SavedRoute.route_id == route_id
-        ).first()
-        
-        if existing:
-            raise ValidationException(
-                message="이미 저장한 경로입니다",
-                field="route_id"
-            )
-        
         saved = SavedRoute(
             user_id=user_id,
             route_id=route_id,
@@ -272,8 +264,19 @@ class RouteService:
             note=note
         )
         
+        # SELECT로 먼저 확인하지 않고 바로 INSERT (user_id, route_id 유니크 제약조건으로 중복 판단)
+        # 왕복 1회로 줄고, 동시 요청에서도 중복 저장되지 않음
         self.db.add(saved)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_duplicate_key_error(e):
+                raise ValidationException(
+                    message="이미 저장한 경로입니다",
+                    field="route_id"
+                )
+            raise
         self.db.refresh(saved)
         
         return saved
@@ -329,16 +332,29 @@ class RouteService:
         Returns:
             tuple: (저장된 경로 목록, 전체 개수)
         """
-        query = self.db.query(SavedRoute).filter(SavedRoute.user_id == user_id)
+        # COUNT(*) 쿼리를 따로 보내지 않고 윈도우 함수로 전체 개수를 함께 조회 (왕복 1회)
+        query = self.db.query(
+            SavedRoute,
+            func.count().over().label("total")
+        ).filter(SavedRoute.user_id == user_id)
         
         # 정렬
         if sort == "date_desc":
             query = query.order_by(SavedRoute.saved_at.desc())
         
-        total = query.count()
-        
         offset = (page - 1) * limit
-        routes = query.offset(offset).limit(limit).all()
+        rows = query.offset(offset).limit(limit).all()
+        
+        routes = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # 마지막 페이지를 넘으면 행이 없어 전체 개수를 알 수 없으므로 따로 조회
+            total = self.db.query(func.count(SavedRoute.id)).filter(
+                SavedRoute.user_id == user_id
+            ).scalar()
+        else:
+            total = 0
         
         return routes, total
     
@@ -387,11 +403,12 @@ class RouteService:
                 status="completed"
             )
             self.db.add(route)
-            self.db.commit()
+            # 커밋 없이 INSERT만 보내 route.id 확보 (경로/옵션/Task 상태를 한 트랜잭션으로 커밋)
+            self.db.flush()
             
             # 3개 옵션 생성
-            for i, opt_type in enumerate(["balanced", "safety", "scenic"]):
-                option = RouteOption(
+            options = [
+                RouteOption(
                     route_id=route.id,
                     option_type=opt_type,
                     distance=task.target_distance + (i * 0.1),
@@ -400,7 +417,9 @@ class RouteService:
                     elevation_gain=50 + (i * 10),
                     path_data={"coordinates": []}
                 )
-                self.db.add(option)
+                for i, opt_type in enumerate(["balanced", "safety", "scenic"])
+            ]
+            self.db.add_all(options)
             
             # 완료 상태 업데이트
             task.status = "completed"
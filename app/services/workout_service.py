@@ -7,8 +7,9 @@
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 
 from app.models.user import User, UserStats
 from app.models.workout import Workout, WorkoutSplit
@@ -16,6 +17,19 @@ from app.models.route import RouteOption
 from app.core.exceptions import NotFoundException, ValidationException
 
 
+# 운동 모드별 MET (달리기 약 10, 그 외 걷기 약 3.5)
+_MET_BY_MODE = {"running": 10.0}
+_DEFAULT_MET = 3.5
+_DEFAULT_WEIGHT_KG = 70  # TODO: 실제 사용자 체중 사용
+
+# 운동 목록 응답에 필요한 컬럼 (ORM 객체 대신 가벼운 Row 튜플로 조회)
+WORKOUT_LIST_COLUMNS = (
+    Workout.id, Workout.route_id, Workout.route_name, Workout.type, Workout.mode,
+    Workout.distance, Workout.duration, Workout.avg_pace, Workout.calories,
+    Workout.route_completion, Workout.started_at, Workout.completed_at,
+)
+
+
 class WorkoutService:
     """
     운동 서비스 클래스
@@ -72,7 +86,9 @@ class WorkoutService:
             Workout: 생성된 운동 세션
         """
         # 이미 진행 중인 운동이 있으면 자동으로 취소 처리
-        active_workouts = self.db.query(Workout).filter(
+        active_workouts = self.db.query(Workout).options(
+            defer(Workout.actual_path)
+        ).filter(
             Workout.user_id == user_id,
             Workout.status.in_(["active", "paused"]),
             Workout.deleted_at.is_(None)
@@ -145,7 +161,7 @@ class WorkoutService:
             elevation_loss: 하강 고도 누적합
             route_completion: 경로 완주율 (%)
         """
-        workout = self._get_workout(workout_id, user_id)
+        workout = self._get_workout(workout_id, user_id, with_path=True)
         
         if workout.status not in ["active", "paused"]:
             raise ValidationException(
@@ -173,15 +189,20 @@ class WorkoutService:
             workout.end_longitude = end_longitude
         
         # ---- workout_splits 테이블에 구간 기록 저장 ----
+        # 구간마다 ORM 객체를 add하지 않고 한 번의 executemany INSERT로 저장
         if splits:
-            for split_data in splits:
-                split = WorkoutSplit(
-                    workout_id=workout.id,
-                    km=split_data["km"],
-                    pace=split_data["pace"],
-                    duration=split_data["duration"],
-                )
-                self.db.add(split)
+            self.db.execute(
+                insert(WorkoutSplit),
+                [
+                    {
+                        "workout_id": workout.id,
+                        "km": split_data["km"],
+                        "pace": split_data["pace"],
+                        "duration": split_data["duration"],
+                    }
+                    for split_data in splits
+                ],
+            )
         
         # ---- 사용자 통계 업데이트 ----
         self._update_user_stats(user_id, workout)
@@ -192,36 +213,24 @@ class WorkoutService:
         return workout
     
     
-    def pause_workout(self, workout_id: str, user_id: str) -> Workout:
+    def pause_workout(self, workout_id: str, user_id: str) -> bool:
         """운동 일시정지"""
-        workout = self._get_workout(workout_id, user_id)
-        
-        if workout.status != "active":
-            raise ValidationException(
-                message="진행 중인 운동만 일시정지할 수 있습니다",
-                field="status"
-            )
-        
-        workout.status = "paused"
-        self.db.commit()
-        
-        return workout
+        self._transition_status(
+            workout_id, user_id,
+            from_status="active", to_status="paused",
+            message="진행 중인 운동만 일시정지할 수 있습니다",
+        )
+        return True
     
     
-    def resume_workout(self, workout_id: str, user_id: str) -> Workout:
+    def resume_workout(self, workout_id: str, user_id: str) -> bool:
         """운동 재개"""
-        workout = self._get_workout(workout_id, user_id)
-        
-        if workout.status != "paused":
-            raise ValidationException(
-                message="일시정지된 운동만 재개할 수 있습니다",
-                field="status"
-            )
-        
-        workout.status = "active"
-        self.db.commit()
-        
-        return workout
+        self._transition_status(
+            workout_id, user_id,
+            from_status="paused", to_status="active",
+            message="일시정지된 운동만 재개할 수 있습니다",
+        )
+        return True
     
     
     def cancel_workout(self, workout_id: str, user_id: str) -> bool:
@@ -264,7 +273,7 @@ class WorkoutService:
     
     def get_workout(self, workout_id: str, user_id: str) -> Optional[Workout]:
         """운동 상세 조회"""
-        return self._get_workout(workout_id, user_id)
+        return self._get_workout(workout_id, user_id, with_path=True)
     
     
     def get_workout_list(
@@ -275,15 +284,25 @@ class WorkoutService:
         workout_type: str = None,
         sort: str = "date_desc"
     ) -> tuple:
-        """운동 기록 목록 조회"""
-        query = self.db.query(Workout).filter(
+        """
+        운동 기록 목록 조회
+        
+        Returns:
+            tuple: (WORKOUT_LIST_COLUMNS 컬럼의 Row 목록, 전체 개수)
+        """
+        filters = [
             Workout.user_id == user_id,
             Workout.status == "completed",
-            Workout.deleted_at.is_(None)
-        )
-        
+            Workout.deleted_at.is_(None),
+        ]
         if workout_type:
-            query = query.filter(Workout.type == workout_type)
+            filters.append(Workout.type == workout_type)
+        
+        # COUNT(*) 쿼리를 따로 보내지 않고 윈도우 함수로 전체 개수를 함께 조회 (왕복 1회)
+        query = self.db.query(
+            *WORKOUT_LIST_COLUMNS,
+            func.count().over().label("total")
+        ).filter(*filters)
         
         if sort == "distance_desc":
             query = query.order_by(Workout.distance.desc())
@@ -294,16 +313,26 @@ class WorkoutService:
         else:
             query = query.order_by(Workout.completed_at.desc())
         
-        total = query.count()
         offset = (page - 1) * limit
-        workouts = query.offset(offset).limit(limit).all()
+        rows = query.offset(offset).limit(limit).all()
+        
+        workouts = rows
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # 마지막 페이지를 넘으면 행이 없어 전체 개수를 알 수 없으므로 따로 조회
+            total = self.db.query(func.count(Workout.id)).filter(*filters).scalar()
+        else:
+            total = 0
         
         return workouts, total
     
     
     def get_active_workout(self, user_id: str) -> Optional[Workout]:
         """현재 진행 중인 운동 조회"""
-        return self.db.query(Workout).filter(
+        return self.db.query(Workout).options(
+            defer(Workout.actual_path)
+        ).filter(
             Workout.user_id == user_id,
             Workout.status.in_(["active", "paused"]),
             Workout.deleted_at.is_(None)
@@ -326,23 +355,33 @@ class WorkoutService:
         if not workout.route_option_id:
             return None
         
-        route_option = self.db.query(RouteOption).filter(
+        # 응답에는 좌표만 필요하므로 RouteOption 엔티티 전체 대신 coordinates 컬럼만 조회
+        row = self.db.query(RouteOption.coordinates).filter(
             RouteOption.id == workout.route_option_id
         ).first()
         
-        if not route_option or not route_option.coordinates:
+        if not row or not row.coordinates:
             return None
         
-        return route_option.coordinates
+        return row.coordinates
     
     
     # ============================================
     # 헬퍼 메서드
     # ============================================
     
-    def _get_workout(self, workout_id: str, user_id: str) -> Workout:
-        """운동 조회 (내부용)"""
-        workout = self.db.query(Workout).filter(
+    def _get_workout(self, workout_id: str, user_id: str, with_path: bool = False) -> Workout:
+        """
+        운동 조회 (내부용)
+        
+        상태 변경만 하는 호출에서는 수백 KB가 될 수 있는 actual_path(JSON)를 읽지 않도록
+        with_path=True 일 때만 함께 조회합니다. (필요 시 접근하면 그때 로드됨)
+        """
+        query = self.db.query(Workout)
+        if not with_path:
+            query = query.options(defer(Workout.actual_path))
+        
+        workout = query.filter(
             Workout.id == workout_id,
             Workout.user_id == user_id,
             Workout.deleted_at.is_(None)
@@ -357,6 +396,40 @@ class WorkoutService:
         return workout
     
     
+    def _transition_status(
+        self,
+        workout_id: str,
+        user_id: str,
+        from_status: str,
+        to_status: str,
+        message: str,
+    ):
+        """
+        운동 상태 변경 (내부용)
+        
+        먼저 SELECT하지 않고 현재 상태 조건을 건 UPDATE 한 번으로 변경 (동시 요청에도 안전)
+        갱신된 행이 없을 때만 조회해서 없는 운동인지, 상태가 맞지 않는지 구분합니다.
+        """
+        result = self.db.execute(
+            update(Workout)
+            .where(
+                Workout.id == workout_id,
+                Workout.user_id == user_id,
+                Workout.deleted_at.is_(None),
+                Workout.status == from_status,
+            )
+            .values(status=to_status)
+            .execution_options(synchronize_session=False)
+        )
+        
+        if result.rowcount == 0:
+            self.db.rollback()
+            self._get_workout(workout_id, user_id)
+            raise ValidationException(message=message, field="status")
+        
+        self.db.commit()
+    
+    
     def _calculate_calories(self, mode: str, duration: int) -> int:
         """
         칼로리 계산
@@ -367,32 +440,36 @@ class WorkoutService:
         if not duration:
             return 0
         
-        met = 10 if mode == "running" else 3.5
-        weight = 70  # TODO: 실제 사용자 체중 사용
+        met = _MET_BY_MODE.get(mode, _DEFAULT_MET)
         hours = duration / 3600
         
-        return int(met * weight * hours)
+        return int(met * _DEFAULT_WEIGHT_KG * hours)
     
     
     def _update_user_stats(self, user_id: str, workout: Workout):
-        """사용자 통계 업데이트 (user_stats 테이블)"""
-        stats = self.db.query(UserStats).filter(
-            UserStats.user_id == user_id
-        ).first()
+        """
+        사용자 통계 업데이트 (user_stats 테이블)
         
-        if stats:
-            stats.total_distance = float(stats.total_distance or 0) + (float(workout.distance) if workout.distance else 0)
-            stats.total_workouts = (stats.total_workouts or 0) + 1
-            if workout.status == "completed":
-                stats.completed_routes = (stats.completed_routes or 0) + 1
-        else:
-            stats = UserStats(
-                user_id=user_id,
-                total_distance=float(workout.distance) if workout.distance else 0,
-                total_workouts=1,
-                completed_routes=1 if workout.status == "completed" else 0
-            )
-            self.db.add(stats)
+        SELECT 후 UPDATE/INSERT 하는 대신 INSERT ... ON DUPLICATE KEY UPDATE 한 번으로 처리
+        (user_id 유니크 키 기준, 동시 완료 요청에도 누적값이 유실되지 않음)
+        """
+        distance = float(workout.distance) if workout.distance else 0
+        completed = 1 if workout.status == "completed" else 0
+        
+        stmt = mysql_insert(UserStats).values(
+            user_id=user_id,
+            total_distance=distance,
+            total_workouts=1,
+            completed_routes=completed,
+            updated_at=datetime.utcnow(),
+        )
+        stmt = stmt.on_duplicate_key_update(
+            total_distance=func.coalesce(UserStats.total_distance, 0) + stmt.inserted.total_distance,
+            total_workouts=func.coalesce(UserStats.total_workouts, 0) + stmt.inserted.total_workouts,
+            completed_routes=func.coalesce(UserStats.completed_routes, 0) + stmt.inserted.completed_routes,
+            updated_at=stmt.inserted.updated_at,
+        )
+        self.db.execute(stmt)
     
     
     def _revert_user_stats(self, user_id: str, workout: Workout):
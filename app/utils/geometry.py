@@ -6,8 +6,13 @@
 import logging
 from typing import List, Dict, Tuple
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# 자기 교차 검사 시 한 번에 계산할 선분 쌍 행렬의 최대 원소 수
+_INTERSECTION_BLOCK_ELEMS = 1 << 20
+
 
 def ccw(A: Tuple[float, float], B: Tuple[float, float], C: Tuple[float, float]) -> float:
     """
@@ -125,25 +130,53 @@ def has_self_intersection(
     
     n = len(path_coords)
     
-    # 모든 선분 쌍을 검사
-    for i in range(n - 1):
-        seg1_start = (path_coords[i]['lat'], path_coords[i]['lng'])
-        seg1_end = (path_coords[i + 1]['lat'], path_coords[i + 1]['lng'])
-        seg1 = (seg1_start, seg1_end)
+    # 좌표를 한 번만 배열로 변환: A[k] -> B[k]가 k번째 선분
+    pts = np.array([(c['lat'], c['lng']) for c in path_coords], dtype=np.float64)
+    A = pts[:-1]
+    B = pts[1:]
+    m = n - 1
+    dx = B[:, 0] - A[:, 0]
+    dy = B[:, 1] - A[:, 1]
+    
+    # 모든 선분 쌍을 이중 루프 대신 (행 블록 x 전체 열) 행렬 연산으로 검사
+    # 행 블록 단위로 나눠 (M x M) 행렬 전체를 한 번에 만들지 않도록 메모리를 제한
+    block = max(1, _INTERSECTION_BLOCK_ELEMS // m)
+    for start in range(0, m - 2, block):
+        stop = min(start + block, m - 2)
+        # i번째 선분과 (i+2)번째 이후 선분들을 비교 ((i+1)번째는 인접 선분이므로 스킵)
+        j0 = start + 2
+        i_idx = np.arange(start, stop)[:, None]
+        j_idx = np.arange(j0, m)[None, :]
+        
+        ax, ay = A[start:stop, 0, None], A[start:stop, 1, None]
+        bx, by = B[start:stop, 0, None], B[start:stop, 1, None]
+        dxi, dyi = dx[start:stop, None], dy[start:stop, None]
+        cx, cy = A[None, j0:, 0], A[None, j0:, 1]
+        ex, ey = B[None, j0:, 0], B[None, j0:, 1]
+        dxj, dyj = dx[None, j0:], dy[None, j0:]
+        
+        # ccw()와 같은 연산 순서로 계산 (ccw1~4는 segments_intersect와 동일한 의미)
+        ccw1 = dxi * (cy - ay) - dyi * (cx - ax)
+        ccw2 = dxi * (ey - ay) - dyi * (ex - ax)
+        ccw3 = dxj * (ay - cy) - dyj * (ax - cx)
+        ccw4 = dxj * (by - cy) - dyj * (bx - cx)
+        
+        # 선분 끝점이 겹치는 경우는 교차로 보지 않음 (자연스러운 연결)
+        shared = (
+            ((ax == cx) & (ay == cy)) | ((ax == ex) & (ay == ey))
+            | ((bx == cx) & (by == cy)) | ((bx == ex) & (by == ey))
+        )
         
-        # i번째 선분과 (i+2)번째 이후 선분들을 비교
-        # (i+1)번째는 인접 선분이므로 스킵
-        for j in range(i + 2, n - 1):
-            seg2_start = (path_coords[j]['lat'], path_coords[j]['lng'])
-            seg2_end = (path_coords[j + 1]['lat'], path_coords[j + 1]['lng'])
-            seg2 = (seg2_start, seg2_end)
-            
-            if segments_intersect(seg1, seg2, tolerance):
-                logger.debug(
-                    f"Self-intersection detected between segment {i}-{i+1} "
-                    f"and segment {j}-{j+1}"
-                )
-                return True
+        hit = (ccw1 * ccw2 < 0) & (ccw3 * ccw4 < 0) & ~shared & (j_idx >= i_idx + 2)
+        if hit.any():
+            # 원래 이중 루프와 같은 순서(i, j 오름차순)의 첫 교차 쌍을 로그로 남김
+            bi, bj = np.unravel_index(int(np.argmax(hit)), hit.shape)
+            i, j = start + int(bi), j0 + int(bj)
+            logger.debug(
+                f"Self-intersection detected between segment {i}-{i+1} "
+                f"and segment {j}-{j+1}"
+            )
+            return True
     
     return False
 
@@ -7,6 +7,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -14,6 +16,7 @@ import numpy as np
 from shapely.geometry import LineString, Point
 from shapely.strtree import STRtree
 from pyproj import Transformer
+from sqlalchemy import cast, Float
 from sqlalchemy.orm import Session
 
 from app.models.safety import Cctv, Light
@@ -24,6 +27,14 @@ LatLng = Dict[str, float]       # {"lat": .., "lng": ..}
 LonLat = Tuple[float, float]    # (lon, lat)
 
 
+# ---------- 인프라 좌표 캐시 ----------
+# cctvs/lights 테이블 전체 조회 결과를 프로세스 내에 보관 (경로 옵션마다 전체 테이블을 다시 읽지 않도록)
+_INFRA_CACHE_TTL_SEC = 600
+
+_infra_cache: Optional[Tuple[float, List[Dict]]] = None
+_infra_cache_lock = threading.Lock()
+
+
 # ---------- 파라미터 ----------
 @dataclass
 class SafetyParams:
@@ -170,26 +181,57 @@ def _load_infra_from_db(db: Session) -> List[Dict]:
     infra: List[Dict] = []
 
     # CCTV 조회
-    cctvs = db.query(Cctv.latitude, Cctv.longitude).all()
+    # 행 전체를 리스트로 적재하지 않고 1000건 단위로 스트리밍
+    cctvs = db.query(
+        cast(Cctv.latitude, Float).label("latitude"),
+        cast(Cctv.longitude, Float).label("longitude"),
+    ).yield_per(1000)
     for row in cctvs:
         infra.append({
             "type": "cctv",
-            "lat": float(row.latitude),
-            "lon": float(row.longitude),
+            "lat": row.latitude,
+            "lon": row.longitude,
         })
 
     # 가로등(보안등) 조회
-    lights = db.query(Light.latitude, Light.longitude).all()
+    lights = db.query(
+        cast(Light.latitude, Float).label("latitude"),
+        cast(Light.longitude, Float).label("longitude"),
+    ).yield_per(1000)
     for row in lights:
         infra.append({
             "type": "lamp",
-            "lat": float(row.latitude),
-            "lon": float(row.longitude),
+            "lat": row.latitude,
+            "lon": row.longitude,
         })
 
     return infra
 
 
+def load_infra_points(db: Session) -> List[Dict]:
+    """
+    _load_infra_from_db 결과를 TTL 동안 캐시해서 반환합니다.
+    반환 리스트는 캐시와 공유되므로 수정하지 않습니다.
+    """
+    global _infra_cache
+    now = time.monotonic()
+    with _infra_cache_lock:
+        if _infra_cache is not None and _infra_cache[0] > now:
+            return _infra_cache[1]
+
+    infra = _load_infra_from_db(db)
+    with _infra_cache_lock:
+        _infra_cache = (time.monotonic() + _INFRA_CACHE_TTL_SEC, infra)
+    return infra
+
+
+def clear_infra_cache() -> None:
+    """CCTV/가로등 데이터 변경 시 호출하여 캐시를 비웁니다."""
+    global _infra_cache
+    with _infra_cache_lock:
+        _infra_cache = None
+
+
 # ============================================
 # 핵심 계산 함수
 # ============================================
@@ -265,6 +307,7 @@ def calculate_safety_score(
     route_coords: List[LatLng],
     db: Session,
     params: Optional[SafetyParams] = None,
+    infra_points: Optional[List[Dict]] = None,
 ) -> int:
     """
     DB에서 인프라 데이터를 조회하고 경로의 안전점수(0~100 정수)를 반환합니다.
@@ -273,6 +316,7 @@ def calculate_safety_score(
         route_coords: [{"lat": float, "lng": float}, ...] 경로 좌표
         db: SQLAlchemy DB 세션
         params: 계산 파라미터 (기본값 사용 시 None)
+        infra_points: 미리 조회한 인프라 좌표 (여러 경로를 연달아 계산할 때 재사용, None이면 캐시/DB 조회)
 
     Returns:
         int: 안전점수 (0~100)
@@ -280,7 +324,8 @@ def calculate_safety_score(
     if not route_coords or len(route_coords) < 2:
         return 0
 
-    infra_points = _load_infra_from_db(db)
+    if infra_points is None:
+        infra_points = load_infra_points(db)
 
     if not infra_points:
         return 0